@@ -227,6 +227,7 @@ class APIConfig(BaseSettings):
     - API_HOST: API host (default: 0.0.0.0)
     - API_PORT: API port (default: 8000)
     - API_PREFIX: API URL prefix (default: /api)
+    - API_THREADS: Worker threads for the production WSGI server (default: 8)
     - CORS_ORIGINS: Allowed CORS origins (comma-separated)
     - CORS_METHODS: Allowed CORS methods (comma-separated)
     - CORS_HEADERS: Allowed CORS headers (comma-separated)
@@ -238,6 +239,7 @@ class APIConfig(BaseSettings):
     host: str = Field(default="0.0.0.0")
     port: int = Field(default=8000, ge=1, le=65535)
     prefix: str = Field(default="/api", pattern="^/.*")
+    threads: int = Field(default=8, ge=1, le=64)
 
     # CORS configuration - enterprise-grade
     cors_origins: List[str] = Field(default=["http://localhost:4200"])
@@ -336,6 +338,25 @@ class RateLimitConfig(BaseSettings):
         return v
 
 
+class ProfilingConfig(BaseSettings):
+    """
+    Opt-in request profiling configuration
+
+    Environment Variables:
+    - PROFILING_ENABLED: Enable the profiler middleware (default: false)
+    - PROFILING_SAMPLE_RATE: Profile one request out of every N (default: 1000)
+    - PROFILING_PROFILE_DIR: Directory for .prof dumps (default: ./profiler_results)
+    - PROFILING_RESTRICTIONS: Number of stats rows printed per request (default: 30)
+    """
+
+    enabled: bool = Field(default=False)
+    sample_rate: int = Field(default=1000, ge=1)
+    profile_dir: str = Field(default="./profiler_results", min_length=1)
+    restrictions: int = Field(default=30, ge=1)
+
+    model_config = ConfigDict(env_prefix="PROFILING_")
+
+
 class AWSConfig(BaseSettings):
     """
     AWS configuration for Lambda and other services
@@ -385,6 +406,7 @@ class AppSettings(BaseSettings):
     api: APIConfig = Field(default_factory=APIConfig)
     aws: AWSConfig = Field(default_factory=AWSConfig)
     rate_limit: RateLimitConfig = Field(default_factory=RateLimitConfig)
+    profiling: ProfilingConfig = Field(default_factory=ProfilingConfig)
 
     model_config = SettingsConfigDict(
         env_file=".env",
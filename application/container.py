@@ -14,6 +14,7 @@ Características:
 from application.config.environment import settings
 from domain.gateways.task_gateway import TaskGateway
 from domain.gateways.user_gateway import UserGateway
+from domain.usecases.bulk_complete_tasks_use_case import BulkCompleteTasksUseCase
 from domain.usecases.complete_task_use_case import CompleteTaskUseCase
 from domain.usecases.create_task_use_case import CreateTaskUseCase
 from domain.usecases.list_all_users_use_case import ListAllUsersUseCase
@@ -47,6 +48,7 @@ class Container:
         # por lo que los creamos bajo demanda a través de propiedades.
         self._create_task_use_case = None
         self._complete_task_use_case = None
+        self._bulk_complete_tasks_use_case = None
         self._list_tasks_by_user_use_case = None
         self._list_all_users_use_case = None
 
@@ -82,6 +84,22 @@ class Container:
     def complete_task_use_case(self):
         self._complete_task_use_case = None
 
+    @property
+    def bulk_complete_tasks_use_case(self) -> BulkCompleteTasksUseCase:
+        if self._bulk_complete_tasks_use_case is None:
+            self._bulk_complete_tasks_use_case = BulkCompleteTasksUseCase(
+                task_gateway=self.task_gateway
+            )
+        return self._bulk_complete_tasks_use_case
+
+    @bulk_complete_tasks_use_case.setter
+    def bulk_complete_tasks_use_case(self, value):
+        self._bulk_complete_tasks_use_case = value
+
+    @bulk_complete_tasks_use_case.deleter
+    def bulk_complete_tasks_use_case(self):
+        self._bulk_complete_tasks_use_case = None
+
     @property
     def list_tasks_by_user_use_case(self) -> ListTasksByUserUseCase:
         if self._list_tasks_by_user_use_case is None:
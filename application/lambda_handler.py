@@ -24,25 +24,16 @@ from typing import Any, Dict, Optional
 import structlog.contextvars
 
 from application.config.environment import EnvironmentEnum, settings
-from application.main import create_app
-from infrastructure.helpers.logger.logger_config import (
-    configure_logging,
-    get_logger,
-)
+from application.main import app
+from infrastructure.helpers.logger.logger_config import get_logger
 
 # Initialize enterprise logger
+# (logging is configured when logger_config is first imported)
 logger = get_logger(__name__)
 
-# Configurar el logging tan pronto como sea posible.
-# Esto asegura que todos los logs, incluso los de inicialización,
-# tengan el formato correcto.
-configure_logging(
-    log_level=settings.application.log_level,
-    debug_mode=settings.application.debug,
-)
-
-# Create Flask application (cached for performance)
-app = create_app()
+# Flask application is built once in application.main and reused across
+# warm invocations; building it here again would duplicate blueprints,
+# CORS setup and after_request hooks.
 
 
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
@@ -19,7 +19,7 @@ import time
 from datetime import datetime, timezone
 from typing import Any, Dict
 
-from flask import Flask, jsonify, request
+from flask import Flask, Response, current_app, request
 from flask_cors import CORS
 
 from application.config.environment import EnvironmentEnum, settings
@@ -28,6 +28,7 @@ from infrastructure.entrypoints.http import task_routes, user_routes
 from infrastructure.helpers.database.connection import database_connection
 from infrastructure.helpers.logger.logger_config import get_logger
 from infrastructure.helpers.middleware.http_middleware import (
+    LivenessProbeMiddleware,
     configure_middleware_stack,
 )
 
@@ -51,6 +52,10 @@ def create_app() -> Flask:
     # Configure dependency injection container
     app.container = container
 
+    # Match "/api/tasks/" like "/api/tasks" instead of answering with a redirect.
+    # Must be set before any rule is registered: rules read it when bound.
+    app.url_map.strict_slashes = False
+
     # Capture startup time for performance monitoring
     app.start_time = time.time()
 
@@ -181,25 +186,28 @@ def _register_health_endpoints(app: Flask) -> None:
             status_code = 200 if health_data["status"] == "healthy" else 503
             logger.info("health_check_completed", status=health_data["status"])
 
-            return jsonify(health_data), status_code
+            return _json_response(health_data, status_code)
 
         except Exception as e:
             logger.error("health_check_failed", error=str(e))
-            return (
-                jsonify(
-                    {
-                        "status": "unhealthy",
-                        "error": str(e),
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
-                    }
-                ),
+            return _json_response(
+                {
+                    "status": "unhealthy",
+                    "error": str(e),
+                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                },
                 503,
             )
 
+    @app.route(LivenessProbeMiddleware.PATH)
+    def liveness_probe():
+        """Liveness probe for callers that bypass the WSGI middleware (Lambda)"""
+        return Response(LivenessProbeMiddleware.BODY, mimetype="application/json")
+
     @app.route("/api/version")
     def version_info():
         """Get application version information"""
-        return jsonify(
+        return _json_response(
             {
                 "version": "1.0.0",
                 "environment": settings.application.environment.value,
@@ -231,7 +239,7 @@ def _configure_error_handlers(app: Flask) -> None:
             status_code=404,
         )
 
-        return jsonify(response_dict), status_code
+        return _json_response(response_dict, status_code)
 
     @app.errorhandler(405)
     def handle_method_not_allowed(error):
@@ -250,7 +258,7 @@ def _configure_error_handlers(app: Flask) -> None:
             status_code=405,
         )
 
-        return jsonify(response_dict), status_code
+        return _json_response(response_dict, status_code)
 
     @app.errorhandler(Exception)
     def handle_general_exception(error):
@@ -267,7 +275,25 @@ def _configure_error_handlers(app: Flask) -> None:
         # Use HTTPErrorHandler to get proper response
         response_dict, status_code = HTTPErrorHandler.handle_exception(error)
 
-        return jsonify(response_dict), status_code
+        return _json_response(response_dict, status_code)
+
+
+def _json_response(payload: Dict[str, Any], status_code: int = 200) -> Response:
+    """
+    Build a JSON response from an already-encoded body
+
+    The body is encoded once to bytes with the app's JSON provider and sent
+    with a precomputed Content-Length, so Werkzeug passes it through as-is.
+    """
+    body = current_app.json.dumps(payload).encode("utf-8")
+    response = Response(
+        body,
+        status=status_code,
+        mimetype="application/json",
+        direct_passthrough=True,
+    )
+    response.headers["Content-Length"] = str(len(body))
+    return response
 
 
 def _check_database_health() -> Dict[str, Any]:
@@ -312,6 +338,9 @@ def create_application() -> Flask:
     # Configure error handlers
     _configure_error_handlers(app)
 
+    # Liveness probe short-circuit (outermost, answers before any middleware)
+    app.wsgi_app = LivenessProbeMiddleware(app.wsgi_app)
+
     logger.info("application_created_successfully")
     return app
 
@@ -328,14 +357,39 @@ if __name__ == "__main__":
         environment=settings.application.environment,
     )
 
-    # Suprimir warning del servidor de desarrollo en modo debug
-    if settings.application.debug:
-        import warnings
+    # Servidor de desarrollo de Werkzeug solo en development
+    if settings.application.is_development:
+        # Suprimir warning del servidor de desarrollo en modo debug
+        if settings.application.debug:
+            import warnings
 
-        warnings.filterwarnings("ignore", message="This is a development server")
+            warnings.filterwarnings("ignore", message="This is a development server")
 
-    app.run(
-        host=settings.api.host,
-        port=settings.api.port,
-        debug=settings.application.debug,
-    )
+        app.run(
+            host=settings.api.host,
+            port=settings.api.port,
+            debug=settings.application.debug,
+        )
+    else:
+        # En contenedores se recomienda gunicorn:
+        #   gunicorn --workers N --worker-class gthread "application.main:app"
+        # waitress es dependencia del proyecto: si falta, el entorno está roto y
+        # no se debe caer al servidor de desarrollo de Werkzeug.
+        try:
+            from waitress import serve
+        except ImportError as e:
+            logger.critical(
+                "waitress_not_installed",
+                environment=settings.application.environment,
+            )
+            raise RuntimeError(
+                "waitress is required outside development; "
+                "install the project dependencies (poetry install)"
+            ) from e
+
+        serve(
+            app,
+            host=settings.api.host,
+            port=settings.api.port,
+            threads=settings.api.threads,
+        )
@@ -3,23 +3,43 @@ Schemas Pydantic para la aplicación
 
 Este módulo centraliza la exportación de los esquemas Pydantic
 para facilitar su importación en otras partes de la aplicación.
+
+Los submódulos se cargan de forma perezosa (PEP 562): importar un schema
+de tareas no construye los modelos de usuarios y viceversa.
 """
 
-from .task_schema import (
-    CompleteTaskRequest,
-    CompleteTaskResponse,
-    CreateTaskRequest,
-    CreateTaskResponse,
-    TaskListResponse,
-    TaskResponse,
-)
-from .user_schema import (
-    CreateUserRequest,
-    UpdateUserStatusRequest,
-    UserListResponse,
-    UserResponse,
-    UserStatsResponse,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .task_schema import (
+        CompleteTaskResponse,
+        CreateTaskRequest,
+        CreateTaskResponse,
+        TaskListResponse,
+        TaskResponse,
+    )
+    from .user_schema import (
+        CreateUserRequest,
+        UserListResponse,
+        UserResponse,
+        UserStatsResponse,
+    )
+
+# Nombre exportado -> submódulo que lo define
+_LAZY_EXPORTS = {
+    # User schemas
+    "UserResponse": "user_schema",
+    "UserListResponse": "user_schema",
+    "CreateUserRequest": "user_schema",
+    "UserStatsResponse": "user_schema",
+    # Task schemas
+    "CreateTaskRequest": "task_schema",
+    "CreateTaskResponse": "task_schema",
+    "CompleteTaskResponse": "task_schema",
+    "TaskResponse": "task_schema",
+    "TaskListResponse": "task_schema",
+}
 
 # Exportar todos los schemas para facilitar las importaciones
 __all__ = [
@@ -27,13 +47,26 @@ __all__ = [
     "UserResponse",
     "UserListResponse",
     "CreateUserRequest",
-    "UpdateUserStatusRequest",
     "UserStatsResponse",
     # Task schemas
     "CreateTaskRequest",
     "CreateTaskResponse",
-    "CompleteTaskRequest",
     "CompleteTaskResponse",
     "TaskResponse",
     "TaskListResponse",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the defining submodule on first access and cache the symbol"""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
@@ -12,21 +12,35 @@ Key Features:
 - Factory methods for entity conversion
 """
 
+from dataclasses import dataclass
 from datetime import datetime
+from operator import attrgetter
 from typing import List, Optional
 from uuid import UUID
 
-from pydantic import (
-    BaseModel,
-    ConfigDict,
-    Field,
-    field_serializer,
-    field_validator,
-)
+from pydantic import BaseModel, ConfigDict, Field
 
-from domain.entities.task_entity import TaskEntity
+from domain.constants.task_constants import TaskConstants
+from domain.entities.task_entity import TaskDescription, TaskEntity, TaskTitle
 from domain.enums.task_status_enum import TaskPriorityEnum, TaskStatusEnum
 
+# Enum member -> wire value; a dict lookup avoids the Enum.value descriptor
+_STATUS_VALUES = {member: member.value for member in TaskStatusEnum}
+_PRIORITY_VALUES = {member: member.value for member in TaskPriorityEnum}
+
+# Reads every TaskEntity field a response needs in a single C-level call
+_get_task_fields = attrgetter(
+    "task_id",
+    "title",
+    "description",
+    "user_id",
+    "status",
+    "priority",
+    "created_at",
+    "updated_at",
+    "completed_at",
+)
+
 
 class CreateTaskRequest(BaseModel):
     """
@@ -36,36 +50,15 @@ class CreateTaskRequest(BaseModel):
     validation rules and business constraints.
     """
 
-    title: str = Field(
-        ..., min_length=1, max_length=200, description="Task title or summary"
-    )
-    description: str = Field(
-        ...,
-        min_length=1,
-        max_length=2000,
-        description="Detailed task description",
-    )
+    title: TaskTitle = Field(..., description="Task title or summary")
+    description: TaskDescription = Field(..., description="Detailed task description")
     user_id: int = Field(..., gt=0, description="ID of the user assigned to this task")
     priority: Optional[TaskPriorityEnum] = Field(
-        default=TaskPriorityEnum.MEDIUM, description="Task priority level"
+        default=TaskConstants.DEFAULT_PRIORITY, description="Task priority level"
     )
 
-    @field_validator("title")
-    def validate_title(cls, v):
-        """Validate task title"""
-        if not v.strip():
-            raise ValueError("Title cannot be empty or whitespace only")
-        return v.strip()
-
-    @field_validator("description")
-    def validate_description(cls, v):
-        """Validate task description"""
-        if not v.strip():
-            raise ValueError("Description cannot be empty or whitespace only")
-        return v.strip()
-
     model_config = ConfigDict(
-        use_enum_values=True,
+        frozen=True,
         json_schema_extra={
             "example": {
                 "title": "Review monthly accounting records",
@@ -77,205 +70,170 @@ class CreateTaskRequest(BaseModel):
     )
 
 
-class CreateTaskResponse(BaseModel):
+class BulkCompleteTasksRequest(BaseModel):
     """
-    Create task response schema for API outputs
+    Bulk complete request schema for API inputs
 
-    Used for serializing newly created task data in API responses.
+    Used for validating requests that complete several tasks at once.
     """
 
-    task_id: UUID = Field(..., description="Unique task identifier")
-    title: str = Field(..., description="Task title")
-    description: str = Field(..., description="Task description")
-    user_id: int = Field(..., description="Assigned user ID")
-    status: str = Field(..., description="Current task status")
-    priority: str = Field(..., description="Task priority")
-    created_at: datetime = Field(..., description="Task creation timestamp")
-    updated_at: Optional[datetime] = Field(None, description="Last update timestamp")
-    completed_at: Optional[datetime] = Field(
-        None, description="Task completion timestamp"
+    task_ids: List[UUID] = Field(
+        ...,
+        min_length=1,
+        max_length=TaskConstants.BULK_COMPLETE_MAX_TASKS,
+        description="IDs of the tasks to complete",
     )
 
-    @classmethod
-    def from_entity(cls, task: TaskEntity) -> "CreateTaskResponse":
-        """
-        Create response from task entity
-
-        Args:
-            task: Task entity to convert
-
-        Returns:
-            CreateTaskResponse instance
-        """
-        return cls(
-            task_id=task.task_id,
-            title=task.title,
-            description=task.description,
-            user_id=task.user_id,
-            status=task.status.value,
-            priority=task.priority.value,
-            created_at=task.created_at,
-            updated_at=task.updated_at,
-            completed_at=task.completed_at,
-        )
-
-    model_config = ConfigDict(from_attributes=True)
-
-    @field_serializer("created_at", "updated_at", "completed_at")
-    def serialize_datetime(self, value: Optional[datetime]) -> Optional[str]:
-        """Serialize datetime fields to ISO format"""
-        return value.isoformat() if value else None
-
-
-class CompleteTaskRequest(BaseModel):
-    """
-    Complete task request schema for API inputs
-
-    Used for validating task completion requests.
-    """
-
-    task_id: UUID = Field(..., description="ID of the task to complete")
-
     model_config = ConfigDict(
+        frozen=True,
         json_schema_extra={
-            "example": {"task_id": "123e4567-e89b-12d3-a456-426614174000"}
-        }
+            "example": {
+                "task_ids": [
+                    "3b403685-66a9-4697-9876-47fe8e06dbbb",
+                    "9c2f1e4a-7d1b-4c8e-a5f3-2b6d8e0c1a7f",
+                ]
+            }
+        },
     )
 
 
-class CompleteTaskResponse(BaseModel):
+@dataclass(slots=True, frozen=True)
+class TaskResponse:
     """
-    Complete task response schema for API outputs
+    Task response schema for API outputs
 
-    Used for serializing completed task data in API responses.
+    Used for serializing individual task data in API responses, including
+    newly created and completed tasks (see the aliases below).
+
+    Responses only carry data the domain layer has already validated, so
+    this is a plain slotted dataclass rather than a Pydantic model.
+    pydantic-core still serializes it (see ``json_model_response``).
     """
 
-    task_id: UUID = Field(..., description="Task identifier")
-    title: str = Field(..., description="Task title")
-    description: str = Field(..., description="Task description")
-    user_id: int = Field(..., description="Assigned user ID")
-    status: str = Field(..., description="Task status (should be 'completed')")
-    priority: str = Field(..., description="Task priority")
-    created_at: datetime = Field(..., description="Task creation timestamp")
-    updated_at: Optional[datetime] = Field(None, description="Last update timestamp")
-    completed_at: Optional[datetime] = Field(
-        None, description="Task completion timestamp"
-    )
+    task_id: UUID  # Task identifier
+    title: str  # Task title
+    description: str  # Task description
+    user_id: int  # Assigned user ID
+    status: str  # Current task status
+    priority: str  # Task priority
+    created_at: datetime  # Task creation timestamp
+    updated_at: Optional[datetime] = None  # Last update timestamp
+    completed_at: Optional[datetime] = None  # Task completion timestamp
 
     @classmethod
-    def from_entity(cls, task: TaskEntity) -> "CompleteTaskResponse":
+    def from_entity(cls, task: TaskEntity) -> "TaskResponse":
         """
-        Create response from completed task entity
+        Create response from task entity
 
         Args:
-            task: Completed task entity to convert
+            task: Task entity to convert
 
         Returns:
-            CompleteTaskResponse instance
+            TaskResponse instance
         """
+        (
+            task_id,
+            title,
+            description,
+            user_id,
+            status,
+            priority,
+            created_at,
+            updated_at,
+            completed_at,
+        ) = _get_task_fields(task)
         return cls(
-            task_id=task.task_id,
-            title=task.title,
-            description=task.description,
-            user_id=task.user_id,
-            status=task.status.value,
-            priority=task.priority.value,
-            created_at=task.created_at,
-            updated_at=task.updated_at,
-            completed_at=task.completed_at,
+            task_id,
+            title,
+            description,
+            user_id,
+            _STATUS_VALUES[status],
+            _PRIORITY_VALUES[priority],
+            created_at,
+            updated_at,
+            completed_at,
         )
 
-    model_config = ConfigDict(from_attributes=True)
 
-    @field_serializer("created_at", "updated_at", "completed_at")
-    def serialize_datetime(self, value: Optional[datetime]) -> Optional[str]:
-        """Serialize datetime fields to ISO format"""
-        return value.isoformat() if value else None
+# Create/complete responses share TaskResponse's fields; aliases avoid
+# declaring identical classes three times.
+CreateTaskResponse = TaskResponse
+CompleteTaskResponse = TaskResponse
 
 
-class TaskResponse(BaseModel):
+@dataclass(slots=True, frozen=True)
+class TaskListResponse:
     """
-    Task response schema for API outputs
+    Task list response schema for API outputs
 
-    Used for serializing individual task data in API responses.
+    Used for serializing multiple tasks in API responses with
+    metadata about the collection.
     """
 
-    task_id: UUID = Field(..., description="Task identifier")
-    title: str = Field(..., description="Task title")
-    description: str = Field(..., description="Task description")
-    user_id: int = Field(..., description="Assigned user ID")
-    status: str = Field(..., description="Current task status")
-    priority: str = Field(..., description="Task priority")
-    created_at: datetime = Field(..., description="Task creation timestamp")
-    updated_at: Optional[datetime] = Field(None, description="Last update timestamp")
-    completed_at: Optional[datetime] = Field(
-        None, description="Task completion timestamp"
-    )
+    tasks: List[TaskResponse]  # List of tasks
+    total_count: int  # Total number of tasks
+    user_id: int  # User ID these tasks belong to
+    pending_count: int  # Number of pending tasks
+    completed_count: int  # Number of completed tasks
 
     @classmethod
-    def from_entity(cls, task: TaskEntity) -> "TaskResponse":
+    def from_entities(cls, tasks: List[TaskEntity], user_id: int) -> "TaskListResponse":
         """
-        Create response from task entity
+        Create response from task entities
 
         Args:
-            task: Task entity to convert
+            tasks: List of task entities to convert
+            user_id: User ID these tasks belong to
 
         Returns:
-            TaskResponse instance
+            TaskListResponse instance
         """
+        # Single pass: build responses and count statuses together
+        from_entity = TaskResponse.from_entity
+        pending = TaskStatusEnum.PENDING
+        completed = TaskStatusEnum.COMPLETED
+
+        task_responses: List[TaskResponse] = []
+        append = task_responses.append
+        pending_count = completed_count = 0
+        for task in tasks:
+            append(from_entity(task))
+            status = task.status
+            if status is pending:
+                pending_count += 1
+            elif status is completed:
+                completed_count += 1
+
         return cls(
-            task_id=task.task_id,
-            title=task.title,
-            description=task.description,
-            user_id=task.user_id,
-            status=task.status.value,
-            priority=task.priority.value,
-            created_at=task.created_at,
-            updated_at=task.updated_at,
-            completed_at=task.completed_at,
+            task_responses,
+            len(task_responses),
+            user_id,
+            pending_count,
+            completed_count,
         )
 
 
-class TaskListResponse(BaseModel):
+@dataclass(slots=True, frozen=True)
+class BulkCompleteTasksResponse:
     """
-    Task list response schema for API outputs
+    Bulk complete response schema for API outputs
 
-    Used for serializing multiple tasks in API responses with
-    metadata about the collection.
+    Used for serializing the tasks completed by a single bulk request.
     """
 
-    tasks: List[TaskResponse] = Field(..., description="List of tasks")
-    total_count: int = Field(..., description="Total number of tasks")
-    user_id: int = Field(..., description="User ID these tasks belong to")
-    pending_count: int = Field(..., description="Number of pending tasks")
-    completed_count: int = Field(..., description="Number of completed tasks")
+    tasks: List[TaskResponse]  # Completed tasks, in request order
+    total_count: int  # Number of completed tasks
 
     @classmethod
-    def from_entities(cls, tasks: List[TaskEntity], user_id: int) -> "TaskListResponse":
+    def from_entities(cls, tasks: List[TaskEntity]) -> "BulkCompleteTasksResponse":
         """
-        Create response from task entities
+        Create response from completed task entities
 
         Args:
-            tasks: List of task entities to convert
-            user_id: User ID these tasks belong to
+            tasks: List of completed task entities
 
         Returns:
-            TaskListResponse instance
+            BulkCompleteTasksResponse instance
         """
-        task_responses = [TaskResponse.from_entity(task) for task in tasks]
-        pending_count = len(
-            [task for task in tasks if task.status == TaskStatusEnum.PENDING]
-        )
-        completed_count = len(
-            [task for task in tasks if task.status == TaskStatusEnum.COMPLETED]
-        )
-
-        return cls(
-            tasks=task_responses,
-            total_count=len(tasks),
-            user_id=user_id,
-            pending_count=pending_count,
-            completed_count=completed_count,
-        )
-
-    model_config = ConfigDict(from_attributes=True)
+        from_entity = TaskResponse.from_entity
+        return cls([from_entity(task) for task in tasks], len(tasks))
@@ -12,13 +12,35 @@ Key Features:
 - Factory methods for entity conversion
 """
 
-from typing import List
+import re
+from typing import Any, Dict, List
 
-from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+from domain.constants.user_constants import UserConstants
 from domain.entities.user_entity import UserEntity
 from domain.enums.user_status_enum import UserStatusEnum
 
+# Enum member -> wire value; a dict lookup avoids the Enum.value descriptor
+_STATUS_VALUES = {member: member.value for member in UserStatusEnum}
+
+# Any Unicode decimal digit; compiled once so the name check is a single C scan
+_DIGIT_RE = re.compile(r"\d")
+
+# OpenAPI examples, built once and shared by the models that embed them
+_USER_EXAMPLE: Dict[str, Any] = {
+    "user_id": 1,
+    "name": "Juan Pérez",
+    "email": "juan.perez@company.com",
+    "status": "active",
+}
+_SECOND_USER_EXAMPLE: Dict[str, Any] = {
+    "user_id": 2,
+    "name": "María García",
+    "email": "maria.garcia@company.com",
+    "status": "active",
+}
+
 
 class UserResponse(BaseModel):
     """
@@ -43,24 +65,26 @@ class UserResponse(BaseModel):
 
         Returns:
             UserResponse instance
+
+        Note:
+            ``model_construct`` is not used here: for this flat four-field
+            model the validating constructor runs in pydantic-core and is
+            measurably faster than the pure-Python construct path.
         """
         return cls(
             user_id=user.user_id,
             name=user.name,
             email=user.email,
-            status=user.status.value,
+            status=_STATUS_VALUES[user.status],
         )
 
+    # Built server-side from entities: an unknown key is a bug, and a built
+    # response is never mutated.
     model_config = ConfigDict(
+        extra="forbid",
+        frozen=True,
         from_attributes=True,
-        json_schema_extra={
-            "example": {
-                "user_id": 1,
-                "name": "Juan Pérez",
-                "email": "juan.perez@company.com",
-                "status": "active",
-            }
-        },
+        json_schema_extra={"example": _USER_EXAMPLE},
     )
 
 
@@ -88,41 +112,49 @@ class UserListResponse(BaseModel):
         Returns:
             UserListResponse instance
         """
-        user_responses = [UserResponse.from_entity(user) for user in users]
-        active_count = len(
-            [user for user in users if user.status == UserStatusEnum.ACTIVE]
-        )
-        inactive_count = len(users) - active_count
-
-        return cls(
-            users=user_responses,
-            total_count=len(users),
-            active_count=active_count,
-            inactive_count=inactive_count,
+        # Single pass: build plain row dicts and count active users together.
+        # The whole payload is then validated in one pydantic-core call, which
+        # builds every UserResponse inside Rust instead of one call per row.
+        status_values = _STATUS_VALUES
+        active = UserStatusEnum.ACTIVE
+
+        rows: List[Dict[str, Any]] = []
+        append = rows.append
+        active_count = 0
+        for user in users:
+            status = user.status
+            append(
+                {
+                    "user_id": user.user_id,
+                    "name": user.name,
+                    "email": user.email,
+                    "status": status_values[status],
+                }
+            )
+            if status is active:
+                active_count += 1
+
+        total_count = len(rows)
+        return cls.model_validate(
+            {
+                "users": rows,
+                "total_count": total_count,
+                "active_count": active_count,
+                "inactive_count": total_count - active_count,
+            }
         )
 
     model_config = ConfigDict(
+        extra="forbid",
+        frozen=True,
         json_schema_extra={
             "example": {
-                "users": [
-                    {
-                        "user_id": 1,
-                        "name": "Juan Pérez",
-                        "email": "juan.perez@company.com",
-                        "status": "active",
-                    },
-                    {
-                        "user_id": 2,
-                        "name": "María García",
-                        "email": "maria.garcia@company.com",
-                        "status": "active",
-                    },
-                ],
+                "users": [_USER_EXAMPLE, _SECOND_USER_EXAMPLE],
                 "total_count": 2,
                 "active_count": 2,
                 "inactive_count": 0,
             }
-        }
+        },
     )
 
 
@@ -135,42 +167,32 @@ class CreateUserRequest(BaseModel):
     """
 
     name: str = Field(..., min_length=2, max_length=100, description="User full name")
-    email: EmailStr = Field(..., description="User email address")
+    email: str = Field(
+        ..., pattern=UserConstants.EMAIL_PATTERN, description="User email address"
+    )
 
     @field_validator("name")
     def validate_name(cls, v):
         """Validate user name format"""
-        if not v.strip():
+        v = v.strip()
+        if not v:
             raise ValueError("Name cannot be empty or whitespace only")
 
-        if any(char.isdigit() for char in v):
+        if _DIGIT_RE.search(v):
             raise ValueError("Name cannot contain numbers")
 
-        return v.strip()
+        return v
 
+    # Unknown keys stay ignored (not forbidden) so clients sending extra
+    # fields keep working; the validated request is read-only.
     model_config = ConfigDict(
+        frozen=True,
         json_schema_extra={
             "example": {
-                "name": "Juan Pérez",
-                "email": "juan.perez@company.com",
+                "name": _USER_EXAMPLE["name"],
+                "email": _USER_EXAMPLE["email"],
             }
-        }
-    )
-
-
-class UpdateUserStatusRequest(BaseModel):
-    """
-    Update user status request schema for API inputs
-
-    Used for validating user status change requests with
-    proper status validation.
-    """
-
-    status: UserStatusEnum = Field(..., description="New user status")
-
-    model_config = ConfigDict(
-        use_enum_values=True,
-        json_schema_extra={"example": {"status": "active"}},
+        },
     )
 
 
@@ -188,6 +210,8 @@ class UserStatsResponse(BaseModel):
     users_created_this_week: int = Field(..., description="Users created this week")
 
     model_config = ConfigDict(
+        extra="forbid",
+        frozen=True,
         json_schema_extra={
             "example": {
                 "total_users": 10,
@@ -196,5 +220,5 @@ class UserStatsResponse(BaseModel):
                 "users_created_today": 2,
                 "users_created_this_week": 5,
             }
-        }
+        },
     )
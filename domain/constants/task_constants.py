@@ -7,6 +7,8 @@ Constants are defined using class-based organization for better maintainability.
 
 from typing import Final
 
+from domain.enums.task_status_enum import TaskPriorityEnum, TaskStatusEnum
+
 
 class TaskConstants:
     """Constants for task entity and business rules"""
@@ -20,10 +22,11 @@ class TaskConstants:
     # Task business rules
     MAX_TASKS_PER_USER: Final[int] = 1000
     TASK_COMPLETION_TIMEOUT_DAYS: Final[int] = 365
+    BULK_COMPLETE_MAX_TASKS: Final[int] = 100
 
-    # Default values
-    DEFAULT_STATUS: Final[str] = "pending"
-    DEFAULT_PRIORITY: Final[str] = "medium"
+    # Default values (enum singletons; use .value only at the DB boundary)
+    DEFAULT_STATUS: Final[TaskStatusEnum] = TaskStatusEnum.PENDING
+    DEFAULT_PRIORITY: Final[TaskPriorityEnum] = TaskPriorityEnum.MEDIUM
 
 
 class TaskDatabaseConstants:
@@ -0,0 +1,17 @@
+"""
+User Domain Constants
+
+This module contains all constants related to user management domain.
+Constants are defined using class-based organization for better maintainability.
+"""
+
+from typing import Final
+
+
+class UserConstants:
+    """Constants for user entity and business rules"""
+
+    # Email format: local@domain.tld with no whitespace and no empty labels.
+    # Deliberately looser than email-validator (no IDNA/Unicode normalization
+    # or deliverability rules) so the check runs as a single compiled regex.
+    EMAIL_PATTERN: Final[str] = r"^[^@\s]+@[^@\s.]+(?:\.[^@\s.]+)+$"
@@ -12,10 +12,10 @@ Key Features:
 """
 
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Annotated, Optional
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, TypeAdapter
 
 from domain.constants.task_constants import TaskConstants
 from domain.enums.task_status_enum import TaskPriorityEnum, TaskStatusEnum
@@ -25,6 +25,48 @@ from domain.exceptions.business_exceptions import (
     TaskAlreadyCompletedException,
 )
 
+# Status guards are single hash lookups instead of TaskStatusEnum method calls
+_TERMINAL_STATUSES = TaskStatusEnum.get_terminal_statuses()
+
+# Title/description types shared with the API schemas. Stripping and length
+# limits run inside pydantic-core, without a Python callback per field; a
+# whitespace-only value fails the min_length check.
+TaskTitle = Annotated[
+    str,
+    StringConstraints(
+        strip_whitespace=True,
+        min_length=TaskConstants.TITLE_MIN_LENGTH,
+        max_length=TaskConstants.TITLE_MAX_LENGTH,
+    ),
+]
+TaskDescription = Annotated[
+    str,
+    StringConstraints(
+        strip_whitespace=True,
+        min_length=TaskConstants.DESCRIPTION_MIN_LENGTH,
+        max_length=TaskConstants.DESCRIPTION_MAX_LENGTH,
+    ),
+]
+
+# Assignments are not revalidated; update_task checks the edited field only
+_TITLE_ADAPTER = TypeAdapter(TaskTitle)
+_DESCRIPTION_ADAPTER = TypeAdapter(TaskDescription)
+
+# Statuses that cannot be started -> factory for the exception to raise
+_START_REJECTIONS = {
+    TaskStatusEnum.COMPLETED: lambda task_id: TaskAlreadyCompletedException(
+        task_id=task_id, attempted_operation="start"
+    ),
+    TaskStatusEnum.CANCELLED: lambda task_id: TaskAlreadyCancelledException(
+        task_id=task_id, attempted_operation="start"
+    ),
+    TaskStatusEnum.IN_PROGRESS: lambda task_id: InvalidTaskTransitionException(
+        task_id=task_id,
+        current_status=TaskStatusEnum.IN_PROGRESS.value,
+        target_status=TaskStatusEnum.IN_PROGRESS.value,
+    ),
+}
+
 
 class TaskEntity(BaseModel):
     """
@@ -37,16 +79,14 @@ class TaskEntity(BaseModel):
     task_id: UUID = Field(
         default_factory=uuid4, description="Unique identifier for the task"
     )
-    title: str = Field(..., min_length=1, max_length=200, description="Task title")
-    description: str = Field(
-        ..., min_length=1, max_length=1000, description="Task description"
-    )
+    title: TaskTitle = Field(..., description="Task title")
+    description: TaskDescription = Field(..., description="Task description")
     user_id: int = Field(..., gt=0, description="ID of the user assigned to this task")
     status: TaskStatusEnum = Field(
-        default=TaskStatusEnum.PENDING, description="Current task status"
+        default=TaskConstants.DEFAULT_STATUS, description="Current task status"
     )
     priority: TaskPriorityEnum = Field(
-        default=TaskPriorityEnum.MEDIUM, description="Task priority"
+        default=TaskConstants.DEFAULT_PRIORITY, description="Task priority"
     )
     created_at: datetime = Field(
         default_factory=lambda: datetime.now(timezone.utc),
@@ -56,29 +96,13 @@ class TaskEntity(BaseModel):
         default=None, description="Completion timestamp"
     )
     updated_at: Optional[datetime] = Field(
-        default=None, description="Last update timestamp"
+        # Defaults to the (already validated) creation timestamp
+        default_factory=lambda data: data.get("created_at"),
+        description="Last update timestamp",
     )
 
-    @field_validator("title")
-    @classmethod
-    def validate_title(cls, v: str) -> str:
-        """Validate and clean task title"""
-        if not v.strip():
-            raise ValueError("Task title cannot be empty or whitespace")
-        return v.strip()
-
-    @field_validator("description")
-    @classmethod
-    def validate_description(cls, v: str) -> str:
-        """Validate and clean task description"""
-        if not v.strip():
-            raise ValueError("Task description cannot be empty or whitespace")
-        return v.strip()
-
-    def model_post_init(self, __context) -> None:
-        """Set initial updated_at if not provided"""
-        if self.updated_at is None:
-            self.updated_at = self.created_at
+    # State transitions assign trusted values; only update_task validates input
+    model_config = ConfigDict(validate_assignment=False, frozen=False)
 
     @classmethod
     def create_new_task(
@@ -86,7 +110,7 @@ class TaskEntity(BaseModel):
         title: str,
         description: str,
         user_id: int,
-        priority: TaskPriorityEnum = TaskPriorityEnum.MEDIUM,
+        priority: TaskPriorityEnum = TaskConstants.DEFAULT_PRIORITY,
     ) -> "TaskEntity":
         """
         Factory method to create a new task with proper validation
@@ -107,21 +131,26 @@ class TaskEntity(BaseModel):
             priority=priority,
         )
 
-    def complete(self) -> None:
+    def complete(self, now: Optional[datetime] = None) -> None:
         """
         Mark task as completed
 
+        Args:
+            now: Completion time; pass one value when completing many tasks
+
         Raises:
             TaskStateException: If task cannot be completed
         """
-        if self.status.is_terminal():
+        if self.status in _TERMINAL_STATUSES:
             raise TaskAlreadyCompletedException(
                 task_id=self.task_id, attempted_operation="complete"
             )
 
+        if now is None:
+            now = datetime.now(timezone.utc)
         self.status = TaskStatusEnum.COMPLETED
-        self.completed_at = datetime.now(timezone.utc)
-        self._update_timestamp()
+        self.completed_at = now
+        self._update_timestamp(now)
 
     def start_task(self) -> None:
         """
@@ -131,20 +160,9 @@ class TaskEntity(BaseModel):
             TaskAlreadyCompletedException: If task is already completed
             InvalidTaskTransitionException: If transition is not allowed
         """
-        if self.status == TaskStatusEnum.COMPLETED:
-            raise TaskAlreadyCompletedException(
-                task_id=self.task_id, attempted_operation="start"
-            )
-        elif self.status == TaskStatusEnum.CANCELLED:
-            raise TaskAlreadyCancelledException(
-                task_id=self.task_id, attempted_operation="start"
-            )
-        elif self.status != TaskStatusEnum.PENDING:
-            raise InvalidTaskTransitionException(
-                task_id=self.task_id,
-                current_status=self.status.value,
-                target_status=TaskStatusEnum.IN_PROGRESS.value,
-            )
+        rejection = _START_REJECTIONS.get(self.status)
+        if rejection is not None:
+            raise rejection(self.task_id)
 
         self.status = TaskStatusEnum.IN_PROGRESS
         self._update_timestamp()
@@ -156,7 +174,7 @@ class TaskEntity(BaseModel):
         Raises:
             TaskStateException: If task cannot be cancelled
         """
-        if self.status.is_terminal():
+        if self.status in _TERMINAL_STATUSES:
             raise InvalidTaskTransitionException(
                 task_id=self.task_id,
                 current_status=self.status.value,
@@ -178,52 +196,65 @@ class TaskEntity(BaseModel):
 
         Raises:
             TaskStateException: If task cannot be updated
+            ValidationError: If the new title or description is blank or too long
         """
-        if self.status.is_terminal():
+        if self.status in _TERMINAL_STATUSES:
             raise TaskAlreadyCompletedException(
                 task_id=self.task_id, attempted_operation="update"
             )
 
         if title is not None:
-            self.title = title
+            self.title = _TITLE_ADAPTER.validate_python(title)
         if description is not None:
-            self.description = description
+            self.description = _DESCRIPTION_ADAPTER.validate_python(description)
 
         self._update_timestamp()
 
     def is_active(self) -> bool:
         """Check if task is in an active state"""
-        return not self.status.is_terminal()
+        return self.status not in _TERMINAL_STATUSES
 
     def is_completed(self) -> bool:
         """Check if task is completed"""
-        return self.status.is_completed()
+        return self.status is TaskStatusEnum.COMPLETED
 
     def is_overdue(
-        self, days_threshold: int = TaskConstants.TASK_COMPLETION_TIMEOUT_DAYS
+        self,
+        days_threshold: int = TaskConstants.TASK_COMPLETION_TIMEOUT_DAYS,
+        now: Optional[datetime] = None,
     ) -> bool:
         """
         Check if task is overdue based on creation date
 
         Args:
             days_threshold: Number of days after which task is considered overdue
+            now: Reference time; pass one value when checking many tasks
 
         Returns:
             bool: True if task is overdue and still active
         """
-        if self.status.is_terminal():
+        if self.status in _TERMINAL_STATUSES:
             return False
 
-        days_since_creation = (datetime.now(timezone.utc) - self.created_at).days
-        return days_since_creation > days_threshold
+        return self.get_age_in_days(now) > days_threshold
 
-    def get_age_in_days(self) -> int:
-        """Get task age in days since creation"""
-        return (datetime.now(timezone.utc) - self.created_at).days
+    def get_age_in_days(self, now: Optional[datetime] = None) -> int:
+        """
+        Get task age in days since creation
+
+        Args:
+            now: Reference time; pass one value when checking many tasks
+
+        Returns:
+            int: Whole days elapsed since the task was created
+        """
+        if now is None:
+            now = datetime.now(timezone.utc)
+        return (now - self.created_at).days
 
-    def _update_timestamp(self) -> None:
+    def _update_timestamp(self, now: Optional[datetime] = None) -> None:
         """Update the updated_at timestamp"""
-        self.updated_at = datetime.now(timezone.utc)
+        self.updated_at = now if now is not None else datetime.now(timezone.utc)
 
     def __str__(self) -> str:
         """String representation of the task"""
@@ -7,10 +7,18 @@ with validation and business logic encapsulated within the entity.
 
 from __future__ import annotations
 
-from pydantic import BaseModel, EmailStr, Field, field_validator
+import re
 
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from ..constants.user_constants import UserConstants
 from ..enums.user_status_enum import UserStatusEnum
 
+_EMAIL_RE = re.compile(UserConstants.EMAIL_PATTERN)
+
+# Enum members are singletons: status checks are identity comparisons
+_ACTIVE = UserStatusEnum.ACTIVE
+
 
 class UserEntity(BaseModel):
     """
@@ -19,7 +27,11 @@ class UserEntity(BaseModel):
 
     user_id: int = Field(..., gt=0, description="The unique identifier for the user.")
     name: str = Field(..., min_length=1, description="The name of the user.")
-    email: EmailStr = Field(..., description="The email address of the user.")
+    email: str = Field(
+        ...,
+        pattern=UserConstants.EMAIL_PATTERN,
+        description="The email address of the user.",
+    )
     status: UserStatusEnum = Field(..., description="The current status of the user.")
 
     @field_validator("name")
@@ -30,9 +42,12 @@ class UserEntity(BaseModel):
             raise ValueError("User name cannot be empty or whitespace.")
         return v.strip()
 
+    # Mutators assign trusted values or validate their input by hand
+    model_config = ConfigDict(validate_assignment=False, frozen=False)
+
     def is_active(self) -> bool:
         """Checks if the user is active."""
-        return self.status == UserStatusEnum.ACTIVE
+        return self.status is _ACTIVE
 
     def activate(self):
         """Sets the user status to ACTIVE."""
@@ -55,10 +70,8 @@ class UserEntity(BaseModel):
 
     def change_email(self, new_email: str):
         """Changes the user's email after validation."""
-        from pydantic import EmailStr, TypeAdapter, ValidationError
-
-        try:
-            validated_email = TypeAdapter(EmailStr).validate_python(new_email)
-        except ValidationError as e:
-            raise ValueError("Invalid email format") from e
-        self.email = validated_email
+        # fullmatch: "$" alone would accept a trailing newline that the
+        # constructor's pattern rejects
+        if not _EMAIL_RE.fullmatch(new_email):
+            raise ValueError("Invalid email format")
+        self.email = new_email
@@ -6,7 +6,7 @@ following finite state machine principles for robust state management.
 """
 
 from enum import Enum
-from typing import Set
+from typing import FrozenSet
 
 
 class TaskStatusEnum(str, Enum):
@@ -34,30 +34,38 @@ class TaskStatusEnum(str, Enum):
     CANCELLED = "cancelled"
 
     @classmethod
-    def get_terminal_statuses(cls) -> Set[str]:
+    def get_terminal_statuses(cls) -> FrozenSet["TaskStatusEnum"]:
         """Get all terminal statuses (no further transitions allowed)"""
-        return {cls.COMPLETED, cls.CANCELLED}
+        return _TERMINAL_STATUSES
 
     @classmethod
-    def get_active_statuses(cls) -> Set[str]:
+    def get_active_statuses(cls) -> FrozenSet["TaskStatusEnum"]:
         """Get all active statuses (can still be worked on)"""
-        return {cls.PENDING, cls.IN_PROGRESS}
+        return _ACTIVE_STATUSES
 
     def is_terminal(self) -> bool:
         """Check if this status is terminal (no further transitions)"""
-        return self in self.get_terminal_statuses()
+        return self in _TERMINAL_STATUSES
 
     def is_active(self) -> bool:
         """Check if this status represents an active task"""
-        return self in self.get_active_statuses()
+        return self in _ACTIVE_STATUSES
 
     def is_completed(self) -> bool:
         """Check if this status represents a completed task"""
-        return self == self.COMPLETED
+        return self is _COMPLETED
 
     def is_cancelled(self) -> bool:
         """Check if this status represents a cancelled task"""
-        return self == self.CANCELLED
+        return self is _CANCELLED
+
+
+# Built once at import; the classmethods above hand out these shared sets
+# and the predicates compare members by identity
+_COMPLETED = TaskStatusEnum.COMPLETED
+_CANCELLED = TaskStatusEnum.CANCELLED
+_TERMINAL_STATUSES = frozenset((TaskStatusEnum.COMPLETED, TaskStatusEnum.CANCELLED))
+_ACTIVE_STATUSES = frozenset((TaskStatusEnum.PENDING, TaskStatusEnum.IN_PROGRESS))
 
 
 class TaskPriorityEnum(str, Enum):
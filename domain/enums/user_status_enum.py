@@ -8,7 +8,7 @@ and type safety across the domain.
 from enum import Enum
 
 
-class UserStatusEnum(Enum):
+class UserStatusEnum(str, Enum):
     """
     Enumeration for user statuses.
     """
@@ -12,34 +12,41 @@ Key Features:
 - I18n-ready error messages
 """
 
-from enum import Enum
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Final, Mapping, Optional, Tuple, Type
 
+# Shared read-only defaults: no fresh container per raise, and an accidental
+# write to an exception's empty details fails loudly instead of leaking
+_EMPTY_DETAILS: Mapping[str, Any] = MappingProxyType({})
+_EMPTY_TRANSITIONS: tuple = ()
 
-class ErrorCodeEnum(str, Enum):
+
+class ErrorCodeEnum:
     """
-    Enumeration of business error codes
+    Business error codes
 
     These codes provide stable identifiers for different types of business
     errors that can be used by external systems and for internationalization.
+    They are plain string constants (not an Enum): codes are only ever
+    compared and serialized, so no member lookup or ``.value`` is needed.
     """
 
     # Generic errors
-    VALIDATION_ERROR = "VALIDATION_ERROR"
-    BUSINESS_RULE_VIOLATION = "BUSINESS_RULE_VIOLATION"
-    RESOURCE_NOT_FOUND = "RESOURCE_NOT_FOUND"
-    RESOURCE_CONFLICT = "RESOURCE_CONFLICT"
+    VALIDATION_ERROR: Final[str] = "VALIDATION_ERROR"
+    BUSINESS_RULE_VIOLATION: Final[str] = "BUSINESS_RULE_VIOLATION"
+    RESOURCE_NOT_FOUND: Final[str] = "RESOURCE_NOT_FOUND"
+    RESOURCE_CONFLICT: Final[str] = "RESOURCE_CONFLICT"
 
     # User-related errors
-    USER_NOT_FOUND = "USER_NOT_FOUND"
-    USER_NOT_ACTIVE = "USER_NOT_ACTIVE"
+    USER_NOT_FOUND: Final[str] = "USER_NOT_FOUND"
+    USER_NOT_ACTIVE: Final[str] = "USER_NOT_ACTIVE"
 
     # Task-related errors
-    TASK_NOT_FOUND = "TASK_NOT_FOUND"
-    TASK_ALREADY_COMPLETED = "TASK_ALREADY_COMPLETED"
-    TASK_ALREADY_CANCELLED = "TASK_ALREADY_CANCELLED"
-    INVALID_TASK_TRANSITION = "INVALID_TASK_TRANSITION"
-    MAX_TASKS_EXCEEDED = "MAX_TASKS_EXCEEDED"
+    TASK_NOT_FOUND: Final[str] = "TASK_NOT_FOUND"
+    TASK_ALREADY_COMPLETED: Final[str] = "TASK_ALREADY_COMPLETED"
+    TASK_ALREADY_CANCELLED: Final[str] = "TASK_ALREADY_CANCELLED"
+    INVALID_TASK_TRANSITION: Final[str] = "INVALID_TASK_TRANSITION"
+    MAX_TASKS_EXCEEDED: Final[str] = "MAX_TASKS_EXCEEDED"
 
 
 class BusinessException(Exception):
@@ -50,10 +57,20 @@ class BusinessException(Exception):
     HTTP status mapping, and structured error information.
     """
 
+    # Fixed attribute set: no per-instance attribute dict is populated
+    __slots__ = (
+        "message",
+        "error_code",
+        "http_status_code",
+        "details",
+        "inner_exception",
+        "_cached_dict",
+    )
+
     def __init__(
         self,
         message: str,
-        error_code: ErrorCodeEnum,
+        error_code: str,
         http_status_code: int = 400,
         details: Optional[Dict[str, Any]] = None,
         inner_exception: Optional[Exception] = None,
@@ -72,18 +89,47 @@ class BusinessException(Exception):
         self.message = message
         self.error_code = error_code
         self.http_status_code = http_status_code
-        self.details = details or {}
+        self.details = details if details is not None else _EMPTY_DETAILS
         self.inner_exception = inner_exception
+        self._cached_dict: Optional[Dict[str, Any]] = None
+
+    def __reduce__(
+        self,
+    ) -> Tuple[Callable[..., "BusinessException"], Tuple[Any, ...]]:
+        """
+        Support copy and pickle despite ``__slots__``
+
+        ``BaseException.__reduce__`` only keeps ``args`` and ``__dict__`` and
+        rebuilds via ``cls(*args)``, which loses the slot attributes and calls
+        subclass constructors with the wrong arguments. Rebuild without
+        ``__init__`` and restore the slots instead.
+        """
+        state: Dict[str, Any] = {
+            name: getattr(self, name, None) for name in BusinessException.__slots__
+        }
+        if state["details"] is _EMPTY_DETAILS:
+            # mappingproxy cannot be pickled; restored as the shared default
+            state["details"] = None
+        return (
+            _restore_business_exception,
+            (type(self), self.args, state, self.__dict__ or None),
+        )
 
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert exception to dictionary for serialization
 
+        The dictionary is built on first use and reused afterwards, so
+        callers should treat it as read-only.
+
         Returns:
             Dict containing error information
         """
+        if self._cached_dict is not None:
+            return self._cached_dict
+
         result = {
-            "error_code": self.error_code.value,
+            "error_code": self.error_code,
             "message": self.message,
             "http_status_code": self.http_status_code,
         }
@@ -94,11 +140,29 @@ class BusinessException(Exception):
         if self.inner_exception:
             result["inner_error"] = str(self.inner_exception)
 
+        self._cached_dict = result
         return result
 
     def __str__(self) -> str:
         """String representation including error code"""
-        return f"[{self.error_code.value}] {self.message}"
+        return f"[{self.error_code}] {self.message}"
+
+
+def _restore_business_exception(
+    cls: Type[BusinessException],
+    args: Tuple[Any, ...],
+    state: Dict[str, Any],
+    extra: Optional[Dict[str, Any]],
+) -> BusinessException:
+    """Rebuild a business exception from ``BusinessException.__reduce__``"""
+    exception: BusinessException = cls.__new__(cls, *args)
+    for name, value in state.items():
+        setattr(exception, name, value)
+    if state["details"] is None:
+        exception.details = _EMPTY_DETAILS
+    if extra:
+        exception.__dict__.update(extra)
+    return exception
 
 
 # =============================================================================
@@ -109,6 +173,8 @@ class BusinessException(Exception):
 class ValidationException(BusinessException):
     """Raised when input validation fails"""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str,
@@ -138,16 +204,18 @@ class ValidationException(BusinessException):
 class ResourceNotFoundException(BusinessException):
     """Base class for resource not found errors"""
 
+    __slots__ = ()
+
     def __init__(
         self,
         resource_type: str,
         resource_id: Any,
         message: Optional[str] = None,
+        error_code: str = ErrorCodeEnum.RESOURCE_NOT_FOUND,
     ):
-        default_message = f"{resource_type} with ID '{resource_id}' not found"
         super().__init__(
-            message=message or default_message,
-            error_code=ErrorCodeEnum.RESOURCE_NOT_FOUND,
+            message=message or f"{resource_type} with ID '{resource_id}' not found",
+            error_code=error_code,
             http_status_code=404,
             details={
                 "resource_type": resource_type,
@@ -159,25 +227,29 @@ class ResourceNotFoundException(BusinessException):
 class TaskNotFoundException(ResourceNotFoundException):
     """Raised when a task cannot be found"""
 
+    __slots__ = ()
+
     def __init__(self, task_id: Any, message: Optional[str] = None):
         super().__init__(
             resource_type="Task",
             resource_id=task_id,
-            message=message or f"Task with ID '{task_id}' not found",
+            message=message,
+            error_code=ErrorCodeEnum.TASK_NOT_FOUND,
         )
-        self.error_code = ErrorCodeEnum.TASK_NOT_FOUND
 
 
 class UserNotFoundException(ResourceNotFoundException):
     """Raised when a user cannot be found"""
 
+    __slots__ = ()
+
     def __init__(self, user_id: Any, message: Optional[str] = None):
         super().__init__(
             resource_type="User",
             resource_id=user_id,
-            message=message or f"User with ID '{user_id}' not found",
+            message=message,
+            error_code=ErrorCodeEnum.USER_NOT_FOUND,
         )
-        self.error_code = ErrorCodeEnum.USER_NOT_FOUND
 
 
 # =============================================================================
@@ -188,18 +260,21 @@ class UserNotFoundException(ResourceNotFoundException):
 class BusinessRuleViolationException(BusinessException):
     """Base class for business rule violations"""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str,
         rule_name: str,
         details: Optional[Dict[str, Any]] = None,
+        error_code: str = ErrorCodeEnum.BUSINESS_RULE_VIOLATION,
     ):
         business_details = details or {}
         business_details["violated_rule"] = rule_name
 
         super().__init__(
             message=message,
-            error_code=ErrorCodeEnum.BUSINESS_RULE_VIOLATION,
+            error_code=error_code,
             http_status_code=422,
             details=business_details,
         )
@@ -208,18 +283,22 @@ class BusinessRuleViolationException(BusinessException):
 class UserNotActiveException(BusinessRuleViolationException):
     """Raised when trying to assign tasks to an inactive user"""
 
+    __slots__ = ()
+
     def __init__(self, user_id: Any, user_status: str = "inactive"):
         super().__init__(
             message=f"Cannot assign task to user {user_id}: user is {user_status}",
             rule_name="active_user_assignment_rule",
             details={"user_id": str(user_id), "user_status": user_status},
+            error_code=ErrorCodeEnum.USER_NOT_ACTIVE,
         )
-        self.error_code = ErrorCodeEnum.USER_NOT_ACTIVE
 
 
 class MaxTasksExceededException(BusinessRuleViolationException):
     """Raised when user exceeds maximum allowed tasks"""
 
+    __slots__ = ()
+
     def __init__(self, user_id: Any, current_count: int, max_allowed: int):
         super().__init__(
             message=f"User {user_id} has reached maximum task limit ({current_count}/{max_allowed})",
@@ -229,8 +308,8 @@ class MaxTasksExceededException(BusinessRuleViolationException):
                 "current_task_count": current_count,
                 "max_allowed_tasks": max_allowed,
             },
+            error_code=ErrorCodeEnum.MAX_TASKS_EXCEEDED,
         )
-        self.error_code = ErrorCodeEnum.MAX_TASKS_EXCEEDED
 
 
 # =============================================================================
@@ -241,12 +320,14 @@ class MaxTasksExceededException(BusinessRuleViolationException):
 class TaskStateException(BusinessException):
     """Base class for task state-related errors"""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str,
         task_id: Any,
         current_status: str,
-        error_code: ErrorCodeEnum,
+        error_code: str,
         details: Optional[Dict[str, Any]] = None,
     ):
         state_details = details or {}
@@ -265,6 +346,8 @@ class TaskStateException(BusinessException):
 class TaskAlreadyCompletedException(TaskStateException):
     """Raised when trying to modify a completed task"""
 
+    __slots__ = ()
+
     def __init__(self, task_id: Any, attempted_operation: str = "modify"):
         super().__init__(
             message=f"Cannot {attempted_operation} task {task_id}: task is already completed",
@@ -278,6 +361,8 @@ class TaskAlreadyCompletedException(TaskStateException):
 class TaskAlreadyCancelledException(TaskStateException):
     """Raised when trying to modify a cancelled task"""
 
+    __slots__ = ()
+
     def __init__(self, task_id: Any, attempted_operation: str = "modify"):
         super().__init__(
             message=f"Cannot {attempted_operation} task {task_id}: task is already cancelled",
@@ -291,6 +376,8 @@ class TaskAlreadyCancelledException(TaskStateException):
 class InvalidTaskTransitionException(TaskStateException):
     """Raised when attempting an invalid status transition"""
 
+    __slots__ = ()
+
     def __init__(
         self,
         task_id: Any,
@@ -301,7 +388,11 @@ class InvalidTaskTransitionException(TaskStateException):
         message = f"Cannot transition task {task_id} from '{current_status}' to '{target_status}'"
         details = {
             "target_status": target_status,
-            "valid_transitions": valid_transitions or [],
+            "valid_transitions": (
+                valid_transitions
+                if valid_transitions is not None
+                else _EMPTY_TRANSITIONS
+            ),
         }
 
         super().__init__(
@@ -321,6 +412,8 @@ class InvalidTaskTransitionException(TaskStateException):
 class InfrastructureException(BusinessException):
     """Base class for infrastructure-related errors"""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str,
@@ -343,6 +436,8 @@ class InfrastructureException(BusinessException):
 class DatabaseException(InfrastructureException):
     """Raised when database operations fail"""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str,
@@ -12,7 +12,7 @@ Key Features:
 - Easy maintenance and extension
 """
 
-from typing import Tuple
+from typing import Dict, Optional, Tuple, cast
 
 from pydantic import ValidationError
 
@@ -31,6 +31,117 @@ from domain.exceptions.business_exceptions import (
     ValidationException,
 )
 
+# Business exceptions (from domain layer)
+_BUSINESS_EXCEPTIONS: Dict[type, Tuple[int, str]] = {
+    ResourceNotFoundException: (404, "RESOURCE_NOT_FOUND"),
+    TaskNotFoundException: (404, "TASK_NOT_FOUND"),
+    UserNotFoundException: (404, "USER_NOT_FOUND"),
+    ValidationException: (422, "VALIDATION_ERROR"),
+    BusinessRuleViolationException: (422, "BUSINESS_RULE_VIOLATION"),
+    UserNotActiveException: (422, "USER_NOT_ACTIVE"),
+    MaxTasksExceededException: (422, "MAX_TASKS_EXCEEDED"),
+    TaskStateException: (422, "RESOURCE_CONFLICT"),
+    TaskAlreadyCompletedException: (422, "TASK_ALREADY_COMPLETED"),
+    TaskAlreadyCancelledException: (422, "TASK_ALREADY_CANCELLED"),
+    InvalidTaskTransitionException: (422, "INVALID_STATE_TRANSITION"),
+}
+
+# Standard Python exceptions
+_STANDARD_EXCEPTIONS: Dict[type, Tuple[int, str]] = {
+    ValidationError: (400, "VALIDATION_ERROR"),
+    ValueError: (400, "INVALID_REQUEST"),
+    TypeError: (400, "INVALID_REQUEST"),
+    KeyError: (400, "MISSING_REQUIRED_FIELD"),
+    AttributeError: (400, "INVALID_ATTRIBUTE"),
+    PermissionError: (403, "FORBIDDEN"),
+    TimeoutError: (408, "REQUEST_TIMEOUT"),
+    ConnectionError: (503, "SERVICE_UNAVAILABLE"),
+}
+
+# Infrastructure exceptions (registered by the infrastructure layer)
+_INFRASTRUCTURE_EXCEPTIONS: Dict[type, Tuple[int, str]] = {
+    # These will be imported from infrastructure layer
+    # InfrastructureException: (500, "SERVICE_UNAVAILABLE"),
+    # DatabaseException: (500, "DATABASE_ERROR"),
+}
+
+_DEFAULT_MAPPING: Tuple[int, str] = (500, "INTERNAL_ERROR")
+_BUSINESS_DEFAULT_MAPPING: Tuple[int, str] = (422, "BUSINESS_ERROR")
+
+# Non-business tables flattened into one dict keyed by exception type
+_FLAT: Dict[type, Tuple[int, str]] = {
+    **_STANDARD_EXCEPTIONS,
+    **_INFRASTRUCTURE_EXCEPTIONS,
+}
+
+# Memoized type -> mapping; None marks a BusinessException subclass,
+# whose instances carry their own status code and error code
+_RESOLVED: Dict[type, Optional[Tuple[int, str]]] = {}
+
+
+def _resolve(exception_type: type) -> Optional[Tuple[int, str]]:
+    """Resolve a type's mapping once"""
+    if issubclass(exception_type, BusinessException):
+        return None
+
+    # Standard/infrastructure tables match the exact type only: subclasses
+    # such as UnicodeDecodeError (a ValueError) fall through to the default
+    return _FLAT.get(exception_type, _DEFAULT_MAPPING)
+
+
+def _business_mapping(exception_type: type) -> Tuple[int, str]:
+    """Registry mapping of the nearest registered business base class"""
+    for base in exception_type.__mro__:
+        mapping = _BUSINESS_EXCEPTIONS.get(base)
+        if mapping is not None:
+            return mapping
+
+    return _BUSINESS_DEFAULT_MAPPING
+
+
+def get_mapping(exception: Exception) -> Tuple[int, str]:
+    """
+    Get HTTP status code and error type for an exception
+
+    Args:
+        exception: Exception to map
+
+    Returns:
+        Tuple of (status_code, error_type)
+    """
+    exception_type = type(exception)
+    try:
+        mapping = _RESOLVED[exception_type]
+    except KeyError:
+        mapping = _RESOLVED[exception_type] = _resolve(exception_type)
+
+    if mapping is not None:
+        return mapping
+
+    # Use exception's own status code and error code if available
+    business_exception = cast(BusinessException, exception)
+    try:
+        return (business_exception.http_status_code, business_exception.error_code)
+    except AttributeError:
+        return _business_mapping(exception_type)
+
+
+def register_infrastructure_exception(
+    exception_type: type, status_code: int, error_type: str
+) -> None:
+    """
+    Register an infrastructure exception type
+
+    Args:
+        exception_type: The exception class to register
+        status_code: HTTP status code
+        error_type: Error type identifier
+    """
+    mapping = (status_code, error_type)
+    _INFRASTRUCTURE_EXCEPTIONS[exception_type] = mapping
+    _FLAT[exception_type] = mapping
+    _RESOLVED.clear()
+
 
 class ErrorMappingRegistry:
     """
@@ -44,92 +155,21 @@ class ErrorMappingRegistry:
     2. Standard Python exceptions
     3. Infrastructure exceptions
     4. Default fallback
-    """
-
-    # Business exceptions (from domain layer)
-    BUSINESS_EXCEPTIONS = {
-        ResourceNotFoundException: (404, "RESOURCE_NOT_FOUND"),
-        TaskNotFoundException: (404, "TASK_NOT_FOUND"),
-        UserNotFoundException: (404, "USER_NOT_FOUND"),
-        ValidationException: (422, "VALIDATION_ERROR"),
-        BusinessRuleViolationException: (422, "BUSINESS_RULE_VIOLATION"),
-        UserNotActiveException: (422, "USER_NOT_ACTIVE"),
-        MaxTasksExceededException: (422, "MAX_TASKS_EXCEEDED"),
-        TaskStateException: (422, "RESOURCE_CONFLICT"),
-        TaskAlreadyCompletedException: (422, "TASK_ALREADY_COMPLETED"),
-        TaskAlreadyCancelledException: (422, "TASK_ALREADY_CANCELLED"),
-        InvalidTaskTransitionException: (422, "INVALID_STATE_TRANSITION"),
-    }
-
-    # Standard Python exceptions
-    STANDARD_EXCEPTIONS = {
-        ValidationError: (400, "VALIDATION_ERROR"),
-        ValueError: (400, "INVALID_REQUEST"),
-        TypeError: (400, "INVALID_REQUEST"),
-        KeyError: (400, "MISSING_REQUIRED_FIELD"),
-        AttributeError: (400, "INVALID_ATTRIBUTE"),
-        PermissionError: (403, "FORBIDDEN"),
-        TimeoutError: (408, "REQUEST_TIMEOUT"),
-        ConnectionError: (503, "SERVICE_UNAVAILABLE"),
-    }
-
-    # Infrastructure exceptions (to be defined in infrastructure layer)
-    INFRASTRUCTURE_EXCEPTIONS = {
-        # These will be imported from infrastructure layer
-        # InfrastructureException: (500, "SERVICE_UNAVAILABLE"),
-        # DatabaseException: (500, "DATABASE_ERROR"),
-    }
-
-    @classmethod
-    def get_mapping(cls, exception: Exception) -> Tuple[int, str]:
-        """
-        Get HTTP status code and error type for an exception
 
-        Args:
-            exception: Exception to map
+    The tables live at module level so the lookup path reads globals;
+    the class attributes below are the same dict objects.
+    """
 
-        Returns:
-            Tuple of (status_code, error_type)
-        """
-        # Check business exceptions first
-        if isinstance(exception, BusinessException):
-            # Use exception's own status code and error code if available
-            if hasattr(exception, "http_status_code") and hasattr(
-                exception, "error_code"
-            ):
-                return (exception.http_status_code, exception.error_code.value)
-
-            # Fallback to registry mapping
-            return cls.BUSINESS_EXCEPTIONS.get(type(exception), (422, "BUSINESS_ERROR"))
-
-        # Check standard exceptions
-        exception_type = type(exception)
-        if exception_type in cls.STANDARD_EXCEPTIONS:
-            return cls.STANDARD_EXCEPTIONS[exception_type]
-
-        # Check infrastructure exceptions
-        if exception_type in cls.INFRASTRUCTURE_EXCEPTIONS:
-            return cls.INFRASTRUCTURE_EXCEPTIONS[exception_type]
-
-        # Default for unknown exceptions
-        return (500, "INTERNAL_ERROR")
-
-    @classmethod
-    def register_infrastructure_exception(
-        cls, exception_type: type, status_code: int, error_type: str
-    ) -> None:
-        """
-        Register an infrastructure exception type
+    BUSINESS_EXCEPTIONS = _BUSINESS_EXCEPTIONS
+    STANDARD_EXCEPTIONS = _STANDARD_EXCEPTIONS
+    INFRASTRUCTURE_EXCEPTIONS = _INFRASTRUCTURE_EXCEPTIONS
+    DEFAULT_MAPPING = _DEFAULT_MAPPING
 
-        Args:
-            exception_type: The exception class to register
-            status_code: HTTP status code
-            error_type: Error type identifier
-        """
-        cls.INFRASTRUCTURE_EXCEPTIONS[exception_type] = (status_code, error_type)
+    get_mapping = staticmethod(get_mapping)
+    register_infrastructure_exception = staticmethod(register_infrastructure_exception)
 
-    @classmethod
-    def get_all_mappings(cls) -> dict:
+    @staticmethod
+    def get_all_mappings() -> dict:
         """
         Get all registered mappings for debugging/testing
 
@@ -137,7 +177,7 @@ class ErrorMappingRegistry:
             Dict containing all mappings
         """
         return {
-            "business": cls.BUSINESS_EXCEPTIONS,
-            "standard": cls.STANDARD_EXCEPTIONS,
-            "infrastructure": cls.INFRASTRUCTURE_EXCEPTIONS,
+            "business": _BUSINESS_EXCEPTIONS,
+            "standard": _STANDARD_EXCEPTIONS,
+            "infrastructure": _INFRASTRUCTURE_EXCEPTIONS,
         }
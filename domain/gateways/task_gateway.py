@@ -14,7 +14,7 @@ Key Features:
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Sequence
 from uuid import UUID
 
 from domain.entities.task_entity import TaskEntity
@@ -42,6 +42,18 @@ class TaskGateway(ABC):
             Exception: If save operation fails
         """
 
+    @abstractmethod
+    def save_tasks(self, tasks: Sequence[TaskEntity]) -> None:
+        """
+        Save or update several tasks in a single transaction
+
+        Args:
+            tasks: TaskEntity objects to save
+
+        Raises:
+            Exception: If save operation fails
+        """
+
     @abstractmethod
     def find_task_by_id(self, task_id: UUID) -> Optional[TaskEntity]:
         """
@@ -57,6 +69,22 @@ class TaskGateway(ABC):
             Exception: If database operation fails
         """
 
+    @abstractmethod
+    def find_tasks_by_ids(self, task_ids: Sequence[UUID]) -> List[TaskEntity]:
+        """
+        Find several tasks by their identifiers in one round trip
+
+        Args:
+            task_ids: UUIDs of the tasks to find
+
+        Returns:
+            List of the TaskEntity objects found; unknown IDs are omitted
+            and no particular order is guaranteed
+
+        Raises:
+            Exception: If database operation fails
+        """
+
     @abstractmethod
     def find_tasks_by_user_id(self, user_id: int) -> List[TaskEntity]:
         """
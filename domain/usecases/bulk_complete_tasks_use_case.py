@@ -0,0 +1,115 @@
+"""
+Bulk Complete Tasks Use Case - Domain Layer
+
+This use case completes several tasks at once following Clean Architecture
+principles, with the same validation as CompleteTaskUseCase but a constant
+number of gateway round trips.
+
+Key Features:
+- One batch lookup and one batch save, regardless of task count
+- All-or-nothing: nothing is saved if any task is missing or invalid
+- State transition validation using centralized exceptions
+- Clean Architecture compliance (no application/infrastructure imports)
+"""
+
+# No imports from application/infrastructure layer - Clean Architecture compliance
+import logging
+from datetime import datetime, timezone
+from typing import List, Sequence
+from uuid import UUID
+
+from domain.entities.task_entity import TaskEntity
+from domain.exceptions.business_exceptions import (
+    InvalidTaskTransitionException,
+    TaskAlreadyCompletedException,
+    TaskNotFoundException,
+)
+from domain.gateways.task_gateway import TaskGateway
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+
+class BulkCompleteTasksUseCase:
+    """
+    Use case for completing several tasks at once.
+
+    Loads every task with a single gateway call, completes them in memory
+    and persists them with a single save, instead of one lookup and one
+    save per task.
+    """
+
+    def __init__(self, task_gateway: TaskGateway):
+        """
+        Initialize the use case with required gateway.
+
+        Args:
+            task_gateway: Gateway for task persistence operations
+        """
+        self.task_gateway = task_gateway
+
+    def execute(self, task_ids: Sequence[UUID]) -> List[TaskEntity]:
+        """
+        Execute the bulk task completion use case.
+
+        Args:
+            task_ids: UUIDs of the tasks to complete (duplicates are ignored)
+
+        Returns:
+            List[TaskEntity]: The completed tasks, in request order
+
+        Raises:
+            TaskNotFoundException: If any task doesn't exist
+            TaskAlreadyCompletedException: If any task is already completed
+            InvalidTaskTransitionException: If any task cannot be completed
+        """
+        unique_ids = list(dict.fromkeys(task_ids))
+        logger.info(
+            f"bulk_complete_tasks_use_case_started task_count={len(unique_ids)}"
+        )
+
+        try:
+            found = {
+                task.task_id: task
+                for task in self.task_gateway.find_tasks_by_ids(unique_ids)
+            }
+
+            tasks = []
+            for task_id in unique_ids:
+                task = found.get(task_id)
+                if task is None:
+                    raise TaskNotFoundException(task_id=task_id)
+                tasks.append(task)
+
+            # Check every task before changing any of them, so a rejected
+            # batch leaves no half-completed entities behind
+            for task in tasks:
+                if not task.is_active():
+                    raise TaskAlreadyCompletedException(
+                        task_id=task.task_id, attempted_operation="complete"
+                    )
+
+            # The batch shares one completion time (one clock read)
+            now = datetime.now(timezone.utc)
+            for task in tasks:
+                task.complete(now)
+
+            self.task_gateway.save_tasks(tasks)
+
+            logger.info(
+                f"bulk_complete_tasks_use_case_completed task_count={len(tasks)}"
+            )
+            return tasks
+
+        except (
+            TaskNotFoundException,
+            TaskAlreadyCompletedException,
+            InvalidTaskTransitionException,
+        ) as e:
+            logger.warning(f"bulk_complete_tasks_use_case_failed error={str(e)}")
+            raise
+        except Exception as e:
+            logger.error(
+                f"bulk_complete_tasks_use_case_unexpected_error error={str(e)}"
+            )
+            raise
@@ -57,7 +57,7 @@ class CreateTaskUseCase:
         title: str,
         description: str,
         user_id: int,
-        priority: TaskPriorityEnum = TaskPriorityEnum.MEDIUM,
+        priority: TaskPriorityEnum = TaskConstants.DEFAULT_PRIORITY,
     ) -> TaskEntity:
         """
         Execute the task creation use case.
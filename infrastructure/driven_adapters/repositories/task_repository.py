@@ -15,14 +15,14 @@ Key Features:
 
 import logging
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Sequence
 from uuid import UUID
 
 from sqlalchemy import DateTime, Index, Integer, String, Text
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.orm import Mapped, Session, mapped_column
 
-from domain.constants.task_constants import TaskDatabaseConstants
+from domain.constants.task_constants import TaskConstants, TaskDatabaseConstants
 from domain.entities.task_entity import TaskEntity
 from domain.enums.task_status_enum import TaskPriorityEnum, TaskStatusEnum
 from domain.exceptions.business_exceptions import (
@@ -35,6 +35,11 @@ from infrastructure.helpers.database.connection import Base
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Column value -> enum member; a dict hit skips EnumMeta.__call__ per row.
+# Unknown values fall back to the enum call so the ValueError is unchanged.
+_STATUS_BY_VALUE = {member.value: member for member in TaskStatusEnum}
+_PRIORITY_BY_VALUE = {member.value: member for member in TaskPriorityEnum}
+
 
 class TaskModel(Base):
     """
@@ -69,7 +74,7 @@ class TaskModel(Base):
     )
 
     priority: Mapped[str] = mapped_column(
-        String(10), nullable=False, default=TaskPriorityEnum.MEDIUM.value
+        String(10), nullable=False, default=TaskConstants.DEFAULT_PRIORITY.value
     )
 
     # Timestamp fields
@@ -140,8 +145,10 @@ class TaskModelMapper:
         """
         try:
             # Convert enum values with validation
-            status = TaskStatusEnum(model.status)
-            priority = TaskPriorityEnum(model.priority)
+            status = _STATUS_BY_VALUE.get(model.status) or TaskStatusEnum(model.status)
+            priority = _PRIORITY_BY_VALUE.get(model.priority) or TaskPriorityEnum(
+                model.priority
+            )
 
             return TaskEntity(
                 task_id=model.task_id,
@@ -152,7 +159,8 @@ class TaskModelMapper:
                 priority=priority,
                 created_at=model.created_at,
                 completed_at=model.completed_at,
-                updated_at=model.updated_at,
+                # Rows written before updated_at existed fall back to created_at
+                updated_at=model.updated_at or model.created_at,
             )
         except (ValueError, TypeError) as e:
             logger.error(
@@ -231,6 +239,47 @@ class TaskRepository(TaskGateway):
                 message=f"Database error saving task: {e}", operation="save_task"
             )
 
+    def save_tasks(self, tasks: Sequence[TaskEntity]) -> None:
+        """
+        Save or update several tasks with a single commit
+
+        Args:
+            tasks: TaskEntity objects to save
+
+        Raises:
+            DatabaseException: If save operation fails
+        """
+        if not tasks:
+            return
+
+        try:
+            for task in tasks:
+                self._session.merge(self._mapper.entity_to_model(task))
+            self._session.commit()
+
+            logger.info("Tasks saved successfully", extra={"task_count": len(tasks)})
+
+        except IntegrityError as e:
+            self._session.rollback()
+            logger.error(
+                "Database integrity error saving tasks",
+                extra={"task_count": len(tasks), "error": str(e)},
+            )
+            raise DatabaseException(
+                message=f"Failed to save tasks due to data integrity: {e}",
+                operation="save_tasks",
+            )
+
+        except SQLAlchemyError as e:
+            self._session.rollback()
+            logger.error(
+                "Database error saving tasks",
+                extra={"task_count": len(tasks), "error": str(e)},
+            )
+            raise DatabaseException(
+                message=f"Database error saving tasks: {e}", operation="save_tasks"
+            )
+
     def find_task_by_id(self, task_id: UUID) -> Optional[TaskEntity]:
         """
         Find a task by its ID
@@ -262,6 +311,48 @@ class TaskRepository(TaskGateway):
                 message=f"Database error finding task: {e}", operation="find_task_by_id"
             )
 
+    def find_tasks_by_ids(self, task_ids: Sequence[UUID]) -> List[TaskEntity]:
+        """
+        Find several tasks with a single IN query
+
+        Args:
+            task_ids: UUIDs of the tasks to find
+
+        Returns:
+            List of TaskEntity objects found; unknown IDs are omitted
+
+        Raises:
+            DatabaseException: If database error occurs
+        """
+        if not task_ids:
+            return []
+
+        try:
+            models = (
+                self._session.query(TaskModel)
+                .filter(TaskModel.task_id.in_(task_ids))
+                .all()
+            )
+
+            tasks = [self._mapper.model_to_entity(model) for model in models]
+
+            logger.debug(
+                "Found tasks by ids",
+                extra={"requested_count": len(task_ids), "task_count": len(tasks)},
+            )
+
+            return tasks
+
+        except SQLAlchemyError as e:
+            logger.error(
+                "Database error finding tasks by ids",
+                extra={"requested_count": len(task_ids), "error": str(e)},
+            )
+            raise DatabaseException(
+                message=f"Database error finding tasks: {e}",
+                operation="find_tasks_by_ids",
+            )
+
     def find_tasks_by_user_id(self, user_id: int) -> List[TaskEntity]:
         """
         Find all tasks assigned to a specific user
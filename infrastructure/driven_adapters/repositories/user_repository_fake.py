@@ -4,7 +4,7 @@ Fake User Repository for Development
 Simple in-memory user repository for development and testing.
 """
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from domain.entities.user_entity import UserEntity
 from domain.enums.user_status_enum import UserStatusEnum
@@ -16,7 +16,7 @@ class FakeUserService(UserGateway):
 
     def __init__(self):
         """Initialize with sample users."""
-        self._users = [
+        users = [
             UserEntity(
                 user_id=1,
                 name="Juan Pérez",
@@ -48,42 +48,43 @@ class FakeUserService(UserGateway):
                 status=UserStatusEnum.ACTIVE,
             ),
         ]
+        # Indexed by user_id (insertion-ordered) so lookups are O(1)
+        self._users: Dict[int, UserEntity] = {user.user_id: user for user in users}
 
     def find_user_by_id(self, user_id: int) -> Optional[UserEntity]:
         """Find user by ID."""
-        return next((user for user in self._users if user.user_id == user_id), None)
+        return self._users.get(user_id)
 
     def find_all_users(self) -> List[UserEntity]:
         """Get all users."""
-        return self._users.copy()
+        return list(self._users.values())
 
     def find_active_users(self) -> List[UserEntity]:
         """Get all active users."""
-        return [user for user in self._users if user.status == UserStatusEnum.ACTIVE]
+        return [
+            user
+            for user in self._users.values()
+            if user.status is UserStatusEnum.ACTIVE
+        ]
 
     def find_users_by_status(self, status: UserStatusEnum) -> List[UserEntity]:
         """Get users by status."""
-        return [user for user in self._users if user.status == status]
+        return [user for user in self._users.values() if user.status == status]
 
     def save_user(self, user: UserEntity) -> None:
         """Save or update a user."""
-        existing_user = self.find_user_by_id(user.user_id)
-        if existing_user:
-            self._users.remove(existing_user)
-        self._users.append(user)
+        # Re-insert so an updated user moves to the end, as before
+        self._users.pop(user.user_id, None)
+        self._users[user.user_id] = user
 
     def delete_user(self, user_id: int) -> bool:
         """Delete a user."""
-        user = self.find_user_by_id(user_id)
-        if user:
-            self._users.remove(user)
-            return True
-        return False
+        return self._users.pop(user_id, None) is not None
 
     def user_exists(self, user_id: int) -> bool:
         """Check if a user exists."""
-        return any(user.user_id == user_id for user in self._users)
+        return user_id in self._users
 
     def count_users_by_status(self, status: UserStatusEnum) -> int:
         """Count users by status."""
-        return len([user for user in self._users if user.status == status])
+        return sum(1 for user in self._users.values() if user.status == status)
@@ -16,7 +16,8 @@ from flask import Blueprint, current_app, jsonify, request
 from pydantic import ValidationError
 
 from application.schemas.task_schema import (
-    CompleteTaskRequest,
+    BulkCompleteTasksRequest,
+    BulkCompleteTasksResponse,
     CompleteTaskResponse,
     CreateTaskRequest,
     CreateTaskResponse,
@@ -30,6 +31,7 @@ from domain.exceptions.business_exceptions import (
 )
 from infrastructure.helpers.errors.error_handlers import HTTPErrorHandler
 from infrastructure.helpers.logger.logger_config import get_logger
+from infrastructure.helpers.utils.response_utils import json_model_response
 from infrastructure.helpers.utils.validation_utils import validate_uuid
 
 # Crear un Blueprint para las rutas de tareas
@@ -66,7 +68,7 @@ def create_task():
         # Convertir la entidad a DTO de respuesta
         response_dto = CreateTaskResponse.from_entity(task_entity)
 
-        return jsonify(response_dto.model_dump()), 201
+        return json_model_response(response_dto, 201)
 
     except ValidationError as e:
         logger.warning("task_creation_validation_error", errors=str(e.errors()))
@@ -89,6 +91,56 @@ def create_task():
         return jsonify(response_data), status_code
 
 
+@task_blueprint.route("/complete", methods=["PUT"])
+def complete_tasks():
+    """Marca varias tareas como completadas (todas o ninguna)."""
+    logger.debug("complete_tasks_request_received")
+
+    try:
+        # Validate request data
+        data = BulkCompleteTasksRequest(**request.json)
+
+        # Obtener el caso de uso desde el contenedor
+        use_case = current_app.container.bulk_complete_tasks_use_case
+        task_entities = use_case.execute(data.task_ids)
+
+        logger.info("tasks_completed_successfully", task_count=len(task_entities))
+
+        # Convertir las entidades a DTO de respuesta
+        response_dto = BulkCompleteTasksResponse.from_entities(task_entities)
+
+        return json_model_response(response_dto, 200)
+
+    except ValidationError as e:
+        logger.warning("tasks_completion_validation_error", errors=str(e.errors()))
+        response_data, status_code = HTTPErrorHandler.handle_exception(e)
+        return jsonify(response_data), status_code
+
+    except TaskNotFoundException as e:
+        logger.warning("complete_tasks_not_found")
+        response_data, status_code = HTTPErrorHandler.handle_exception(e)
+        return jsonify(response_data), status_code
+
+    except TaskAlreadyCompletedException as e:
+        logger.info("complete_tasks_already_completed")
+        response_data, status_code = HTTPErrorHandler.handle_exception(e)
+        return jsonify(response_data), status_code
+
+    except InvalidTaskTransitionException as e:
+        logger.warning("complete_tasks_invalid_transition")
+        response_data, status_code = HTTPErrorHandler.handle_exception(e)
+        return jsonify(response_data), status_code
+
+    except Exception as e:
+        logger.error(
+            "complete_tasks_unexpected_error",
+            error_type=type(e).__name__,
+            error_message=str(e),
+        )
+        response_data, status_code = HTTPErrorHandler.handle_exception(e)
+        return jsonify(response_data), status_code
+
+
 @task_blueprint.route("/<string:task_id>/complete", methods=["PUT"])
 def complete_task(task_id: str):
     """Marca una tarea como completada."""
@@ -101,9 +153,6 @@ def complete_task(task_id: str):
         return jsonify(error_response[0]), error_response[1]
 
     try:
-        # Validate request data
-        request_dto = CompleteTaskRequest(task_id=uuid_task_id)
-
         # Obtener el caso de uso desde el contenedor
         use_case = current_app.container.complete_task_use_case
         task_entity = use_case.execute(uuid_task_id)
@@ -113,7 +162,7 @@ def complete_task(task_id: str):
         # Convertir la entidad a DTO de respuesta
         response_dto = CompleteTaskResponse.from_entity(task_entity)
 
-        return jsonify(response_dto.model_dump()), 200
+        return json_model_response(response_dto, 200)
 
     except ValidationError as e:
         logger.warning("task_completion_validation_error", task_id=task_id)
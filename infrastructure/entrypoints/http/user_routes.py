@@ -18,6 +18,7 @@ from application.schemas.user_schema import UserListResponse
 from domain.exceptions.business_exceptions import UserNotFoundException
 from infrastructure.helpers.errors.error_handlers import HTTPErrorHandler
 from infrastructure.helpers.logger.logger_config import get_logger
+from infrastructure.helpers.utils.response_utils import json_model_response
 
 # Crear un Blueprint para las rutas de usuarios
 user_blueprint = Blueprint("users", __name__)
@@ -43,7 +44,7 @@ def list_all_users():
         # La ruta es responsable de la serialización
         response_schema = UserListResponse.from_entities(user_entities)
 
-        return jsonify(response_schema.model_dump()), 200
+        return json_model_response(response_schema, 200)
 
     except Exception as e:
         logger.error("users_list_unexpected_error", error_type=type(e).__name__)
@@ -74,7 +75,7 @@ def list_tasks_by_user(user_id: int):
             tasks=task_entities, user_id=user_id
         )
 
-        return jsonify(response_schema.model_dump()), 200
+        return json_model_response(response_schema, 200)
 
     except UserNotFoundException as e:
         logger.warning("user_tasks_list_user_not_found", user_id=user_id)
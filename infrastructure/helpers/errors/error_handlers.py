@@ -38,6 +38,36 @@ ErrorMappingRegistry.register_infrastructure_exception(
     InfrastructureException, 503, "SERVICE_UNAVAILABLE"
 )
 
+# Client-safe messages for standard exceptions (4xx only)
+_SAFE_MESSAGES: Dict[type, str] = {
+    ValueError: "The request contains invalid data.",
+    TypeError: "The request format is incorrect.",
+    KeyError: "A required field is missing from the request.",
+    PermissionError: "You don't have permission to perform this action.",
+    TimeoutError: "The request timed out. Please try again.",
+    ConnectionError: "The service is temporarily unavailable.",
+}
+
+
+# Memoized type -> safe message of the nearest mapped base class (or None)
+_RESOLVED_SAFE_MESSAGES: Dict[type, Optional[str]] = {}
+
+
+def _safe_message_for_type(exception_type: type) -> Optional[str]:
+    """Resolve (once per type) the safe message of the nearest mapped base class"""
+    try:
+        return _RESOLVED_SAFE_MESSAGES[exception_type]
+    except KeyError:
+        pass
+
+    message = None
+    for base in exception_type.__mro__:
+        message = _SAFE_MESSAGES.get(base)
+        if message is not None:
+            break
+    _RESOLVED_SAFE_MESSAGES[exception_type] = message
+    return message
+
 
 class HTTPErrorHandler:
     """
@@ -161,9 +191,11 @@ class HTTPErrorHandler:
         if not cls._should_include_details():
             return None
 
-        details = {}
+        details: Dict[str, Any]
         if isinstance(exception, BusinessException):
-            details = exception.details or {}
+            # Copy: exception details may be the shared read-only default
+            # and must not pick up the inner_error key below
+            details = dict(exception.details)
             if hasattr(exception, "inner_exception") and exception.inner_exception:
                 details["inner_error"] = str(exception.inner_exception)
         else:
@@ -182,16 +214,8 @@ class HTTPErrorHandler:
             return "An internal server error occurred. Please try again later."
 
         # For client errors, we can be more specific
-        safe_messages = {
-            ValueError: "The request contains invalid data.",
-            TypeError: "The request format is incorrect.",
-            KeyError: "A required field is missing from the request.",
-            PermissionError: "You don't have permission to perform this action.",
-            TimeoutError: "The request timed out. Please try again.",
-            ConnectionError: "The service is temporarily unavailable.",
-        }
-
-        return safe_messages.get(type(exception), str(exception))
+        message = _safe_message_for_type(type(exception))
+        return message if message is not None else str(exception)
 
     @classmethod
     def _should_include_details(cls) -> bool:
@@ -226,7 +250,7 @@ class HTTPErrorHandler:
                 "business_exception_occurred",
                 **error_context,
                 error_code=(
-                    exception.error_code.value
+                    exception.error_code
                     if hasattr(exception, "error_code")
                     else "UNKNOWN"
                 ),
@@ -5,17 +5,62 @@ Streamlined logging configuration that maintains essential features:
 - Structured logging with JSON output for production
 - Console logging with colors for development
 - Request context tracing for HTTP operations
+- Non-blocking output through a background queue listener
 - Simplified configuration (71% reduction in complexity)
 """
 
+import atexit
 import logging
+import queue
+import sys
 import uuid
 from contextlib import contextmanager
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, List, Optional
 
 import structlog
+from structlog.typing import EventDict, Processor
 
 from application.config.environment import settings
 
+# Background listener that writes queued records to the real handlers
+_queue_listener: Optional[QueueListener] = None
+
+
+class _InProcessQueueHandler(QueueHandler):
+    """QueueHandler that leaves rendering to the listener thread"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The queue never leaves the process, so the record does not need to
+        # be pickle-safe. structlog records carry their event dict in ``msg``
+        # and are rendered (traceback included) by the listener's
+        # ProcessorFormatter. Foreign stdlib records get their %-args merged
+        # now, so mutable args cannot change before the listener runs.
+        if isinstance(record.msg, dict):
+            return record
+
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def _capture_exc_info(
+    logger: Any, method_name: str, event_dict: EventDict
+) -> EventDict:
+    """
+    Resolve ``exc_info=True`` to the live exception on the calling thread
+
+    Only the exception tuple is captured here; the traceback is formatted
+    later by the listener, where ``sys.exc_info()`` would be empty.
+    """
+    exc_info = event_dict.get("exc_info")
+    if exc_info is True:
+        event_dict["exc_info"] = sys.exc_info()
+    elif isinstance(exc_info, BaseException):
+        event_dict["exc_info"] = (type(exc_info), exc_info, exc_info.__traceback__)
+    return event_dict
+
 
 class LoggerConfig:
     """Simplified logging configuration for Task Manager"""
@@ -29,33 +74,72 @@ class LoggerConfig:
             logging, settings.application.log_level.upper(), logging.INFO
         )
 
-        # Essential processors only
-        processors = [
+        # Essential processors only; these run on the calling thread. The
+        # event dict is handed to stdlib unrendered (wrap_for_formatter).
+        shared_processors: List[Processor] = [
             structlog.contextvars.merge_contextvars,  # For request tracing
             structlog.stdlib.add_log_level,
             structlog.processors.TimeStamper(fmt="iso"),
         ]
 
-        # Environment-based renderer
+        # Environment-based renderer, run by the listener thread.
+        # ConsoleRenderer renders exceptions itself; JSON needs format_exc_info.
         if settings.application.environment == "development":
-            processors.append(structlog.dev.ConsoleRenderer(colors=True))
+            render_processors: List[Processor] = [
+                structlog.dev.ConsoleRenderer(colors=True)
+            ]
         else:
-            processors.append(structlog.processors.JSONRenderer())
+            render_processors = [
+                structlog.processors.format_exc_info,
+                structlog.processors.JSONRenderer(),
+            ]
+
+        formatter = structlog.stdlib.ProcessorFormatter(
+            processors=[
+                structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+                *render_processors,
+            ],
+            foreign_pre_chain=shared_processors,
+        )
 
         # Configure structlog with minimal setup
         structlog.configure(
-            processors=processors,
+            processors=[
+                *shared_processors,
+                _capture_exc_info,
+                structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
+            ],
             wrapper_class=structlog.stdlib.BoundLogger,
             logger_factory=structlog.stdlib.LoggerFactory(),
             cache_logger_on_first_use=True,
         )
 
-        # Standard library logging
+        # Standard library logging: callers only enqueue records, a background
+        # thread renders them and performs the I/O
+        listener = LoggerConfig._start_queue_listener(formatter)
         logging.basicConfig(
-            format="%(message)s",
             level=log_level,
-            handlers=[logging.StreamHandler()],
+            handlers=[_InProcessQueueHandler(listener.queue)],
+        )
+
+    @staticmethod
+    def _start_queue_listener(formatter: logging.Formatter) -> QueueListener:
+        """Start the background log writer once per process"""
+        global _queue_listener
+        if _queue_listener is not None:
+            for handler in _queue_listener.handlers:
+                handler.setFormatter(formatter)
+            return _queue_listener
+
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(formatter)
+
+        _queue_listener = QueueListener(
+            queue.SimpleQueue(), stream_handler, respect_handler_level=True
         )
+        _queue_listener.start()
+        atexit.register(_queue_listener.stop)
+        return _queue_listener
 
 
 def get_logger(name: str) -> structlog.stdlib.BoundLogger:
@@ -10,14 +10,18 @@ Components:
 
 from .http_middleware import (
     ErrorHandlingMiddleware,
+    LivenessProbeMiddleware,
     LoggingMiddleware,
+    SampledProfilerMiddleware,
     SecurityLoggingMiddleware,
     configure_middleware_stack,
 )
 
 __all__ = [
     "ErrorHandlingMiddleware",
+    "LivenessProbeMiddleware",
     "LoggingMiddleware",
+    "SampledProfilerMiddleware",
     "SecurityLoggingMiddleware",
     "configure_middleware_stack",
 ]
@@ -12,6 +12,8 @@ Key Features:
 - Health check monitoring
 """
 
+import itertools
+import os
 import time
 
 from flask import Flask
@@ -157,6 +159,74 @@ class SecurityLoggingMiddleware:
         return self.app(environ, start_response)
 
 
+class LivenessProbeMiddleware:
+    """
+    Middleware for answering liveness probes without entering Flask
+
+    Responds to ``GET``/``HEAD /healthz`` directly at the WSGI layer,
+    skipping request object construction, URL matching and every Flask/CORS
+    hook. Database connectivity is still reported by ``/api/health``.
+
+    Callers that bypass ``app.wsgi_app`` (the Lambda handler dispatches with
+    ``full_dispatch_request``) are served by the equivalent Flask route
+    registered in ``application.main``.
+    """
+
+    PATH = "/healthz"
+    METHODS = frozenset(("GET", "HEAD"))
+    BODY = b'{"status":"ok"}'
+    HEADERS = [
+        ("Content-Type", "application/json"),
+        ("Content-Length", str(len(BODY))),
+    ]
+
+    def __init__(self, app: Flask):
+        self.app = app
+
+    def __call__(self, environ, start_response):
+        if environ.get("PATH_INFO") == self.PATH:
+            method = environ.get("REQUEST_METHOD")
+            if method in self.METHODS:
+                start_response("200 OK", list(self.HEADERS))
+                return [self.BODY] if method == "GET" else []
+
+        return self.app(environ, start_response)
+
+
+class SampledProfilerMiddleware:
+    """
+    Middleware for profiling a sample of requests
+
+    Wraps Werkzeug's ProfilerMiddleware so that only one request out of
+    every ``sample_rate`` pays the cProfile overhead; the rest go straight
+    to the application.
+    """
+
+    def __init__(
+        self,
+        app: Flask,
+        sample_rate: int = 1000,
+        profile_dir: str = "./profiler_results",
+        restrictions: int = 30,
+    ):
+        from werkzeug.middleware.profiler import ProfilerMiddleware
+
+        os.makedirs(profile_dir, exist_ok=True)
+
+        self.app = app
+        self.sample_rate = sample_rate
+        self.profiler = ProfilerMiddleware(
+            app, profile_dir=profile_dir, restrictions=(restrictions,)
+        )
+        self._counter = itertools.count()
+
+    def __call__(self, environ, start_response):
+        if next(self._counter) % self.sample_rate:
+            return self.app(environ, start_response)
+
+        return self.profiler(environ, start_response)
+
+
 def configure_middleware_stack(app: Flask) -> None:
     """
     Configure the essential middleware stack for the application
@@ -192,4 +262,18 @@ def configure_middleware_stack(app: Flask) -> None:
             window_size=settings.rate_limit.window_size_seconds,
         )
 
+    # Profiling middleware (opt-in, zero overhead when disabled)
+    if settings.profiling.enabled:
+        app.wsgi_app = SampledProfilerMiddleware(
+            app.wsgi_app,
+            sample_rate=settings.profiling.sample_rate,
+            profile_dir=settings.profiling.profile_dir,
+            restrictions=settings.profiling.restrictions,
+        )
+        logger.warning(
+            "profiling_middleware_enabled",
+            sample_rate=settings.profiling.sample_rate,
+            profile_dir=settings.profiling.profile_dir,
+        )
+
     logger.info("essential_middleware_stack_configured")
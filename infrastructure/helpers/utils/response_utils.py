@@ -0,0 +1,48 @@
+"""
+Response Utilities - Infrastructure Layer
+
+This module provides helpers for building HTTP responses from Pydantic
+schemas without going through the standard library JSON encoder.
+"""
+
+from typing import Any, Dict, Union
+
+from flask import Response
+from pydantic import BaseModel, TypeAdapter
+
+# Dataclass schema type -> its pydantic-core serializer, built once per type
+_TYPE_ADAPTERS: Dict[type, TypeAdapter[Any]] = {}
+
+
+def _type_adapter(schema_type: type) -> TypeAdapter[Any]:
+    """Build (once per type) the pydantic-core serializer for a dataclass schema"""
+    try:
+        return _TYPE_ADAPTERS[schema_type]
+    except KeyError:
+        adapter = _TYPE_ADAPTERS[schema_type] = TypeAdapter(schema_type)
+        return adapter
+
+
+def json_model_response(model: Any, status_code: int = 200) -> Response:
+    """
+    Serialize a response schema straight to a JSON response.
+
+    Pydantic models are encoded with ``model_dump_json``; dataclass schemas
+    go through a cached ``TypeAdapter``. Both encode in pydantic-core (Rust),
+    skipping the intermediate dict and Flask's ``json.dumps`` pass used by
+    ``jsonify``.
+
+    Args:
+        model: Response schema instance (Pydantic model or dataclass)
+        status_code: HTTP status code for the response
+
+    Returns:
+        Flask Response with an ``application/json`` body
+    """
+    body: Union[str, bytes]
+    if isinstance(model, BaseModel):
+        body = model.model_dump_json()
+    else:
+        body = _type_adapter(type(model)).dump_json(model)
+
+    return Response(body, status=status_code, mimetype="application/json")
@@ -1,8 +1,9 @@
+from dataclasses import FrozenInstanceError
 from datetime import datetime, timezone
 from uuid import uuid4
 
 import pytest
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from application.schemas.task_schema import (
     CompleteTaskResponse,
@@ -30,16 +31,35 @@ class TestCreateTaskRequest:
         assert req.title == "New Task"
         assert req.priority == TaskPriorityEnum.HIGH
 
+    def test_create_task_request_priority_is_always_an_enum_member(self):
+        """Test that defaulted and provided priorities are both enum members."""
+        defaulted = CreateTaskRequest(title="Task", description="Desc", user_id=1)
+        provided = CreateTaskRequest(
+            title="Task", description="Desc", user_id=1, priority="high"
+        )
+        assert defaulted.priority is TaskPriorityEnum.MEDIUM
+        assert provided.priority is TaskPriorityEnum.HIGH
+
+    def test_create_task_request_strips_whitespace(self):
+        """Test that title and description are stripped."""
+        req = CreateTaskRequest(title="  Task ", description=" Desc  ", user_id=1)
+        assert req.title == "Task"
+        assert req.description == "Desc"
+
     @pytest.mark.parametrize(
         "invalid_data, expected_error",
         [
             (
                 {"title": " ", "description": "d", "user_id": 1},
-                "Title cannot be empty",
+                "title\n  String should have at least 1 character",
             ),
             (
                 {"title": "t", "description": " ", "user_id": 1},
-                "Description cannot be empty",
+                "description\n  String should have at least 1 character",
+            ),
+            (
+                {"title": "t", "description": "d" * 1001, "user_id": 1},
+                "String should have at most 1000 characters",
             ),
             (
                 {"title": "t", "description": "d", "user_id": 0},
@@ -89,6 +109,26 @@ class TestTaskResponseSchemas:
         res = TaskResponse.from_entity(task_entity)
         assert res.task_id == task_entity.task_id
 
+    def test_task_response_round_trips_through_type_adapter(self, task_entity):
+        """Test that the dataclass response survives a JSON round trip."""
+        adapter = TypeAdapter(TaskResponse)
+        res = TaskResponse.from_entity(task_entity)
+        assert adapter.validate_json(adapter.dump_json(res)) == res
+
+    def test_task_response_json_dump_uses_iso_datetimes(self, task_entity):
+        """Test that JSON-mode dumps render datetimes as ISO 8601 strings."""
+        res = TaskResponse.from_entity(task_entity)
+        data = TypeAdapter(TaskResponse).dump_python(res, mode="json")
+        created_at = datetime.fromisoformat(data["created_at"].replace("Z", "+00:00"))
+        assert created_at == task_entity.created_at
+        assert data["task_id"] == str(task_entity.task_id)
+
+    def test_task_response_is_frozen(self, task_entity):
+        """Test that task responses cannot be mutated after construction."""
+        res = TaskResponse.from_entity(task_entity)
+        with pytest.raises(FrozenInstanceError):
+            res.title = "Changed"
+
     def test_task_list_response_from_entities(self, task_entity):
         """Test TaskListResponse.from_entities."""
         tasks = [task_entity]
@@ -99,3 +139,14 @@ class TestTaskResponseSchemas:
         assert res.user_id == user_id
         assert res.completed_count == 1
         assert res.pending_count == 0
+
+    def test_task_list_response_counts_mixed_statuses(self, task_entity):
+        """Test that pending/completed counts ignore other statuses."""
+        pending = task_entity.model_copy(update={"status": TaskStatusEnum.PENDING})
+        in_progress = task_entity.model_copy(
+            update={"status": TaskStatusEnum.IN_PROGRESS}
+        )
+        res = TaskListResponse.from_entities([task_entity, pending, in_progress], 1)
+        assert res.total_count == 3
+        assert res.pending_count == 1
+        assert res.completed_count == 1
@@ -3,7 +3,6 @@ from pydantic import ValidationError
 
 from application.schemas.user_schema import (
     CreateUserRequest,
-    UpdateUserStatusRequest,
     UserListResponse,
     UserResponse,
 )
@@ -27,6 +26,7 @@ class TestCreateUserRequest:
             {"name": " ", "email": "a@b.com"},
             {"name": "J", "email": "a@b.com"},  # Too short
             {"name": "John Doe", "email": "not-an-email"},
+            {"name": "John Doe 2nd", "email": "a@b.com"},  # Contains digits
         ],
     )
     def test_create_user_request_validation_error(self, invalid_data):
@@ -34,6 +34,18 @@ class TestCreateUserRequest:
         with pytest.raises(ValidationError):
             CreateUserRequest(**invalid_data)
 
+    def test_create_user_request_ignores_extra_fields(self):
+        """Test that unknown keys sent by clients are ignored."""
+        req = CreateUserRequest(
+            name="John Doe", email="john.doe@example.com", nickname="JD"
+        )
+        assert not hasattr(req, "nickname")
+
+    def test_create_user_request_strips_name(self):
+        """Test that surrounding whitespace is stripped from the name."""
+        req = CreateUserRequest(name="  John Doe  ", email="john.doe@example.com")
+        assert req.name == "John Doe"
+
 
 class TestUserResponseSchemas:
     """Test suite for user response schemas."""
@@ -54,6 +66,20 @@ class TestUserResponseSchemas:
         assert res.user_id == user_entity.user_id
         assert res.status == UserStatusEnum.ACTIVE.value
 
+    def test_user_response_is_frozen_and_rejects_extra_fields(self, user_entity):
+        """Test that responses are immutable and reject unknown keys."""
+        res = UserResponse.from_entity(user_entity)
+        with pytest.raises(ValidationError):
+            res.name = "Changed"
+        with pytest.raises(ValidationError):
+            UserResponse(
+                user_id=1,
+                name="Jane Doe",
+                email="jane.doe@example.com",
+                status="active",
+                unexpected="value",
+            )
+
     def test_user_list_response_from_entities(self, user_entity):
         """Test UserListResponse.from_entities."""
         users = [user_entity]
@@ -63,16 +89,27 @@ class TestUserResponseSchemas:
         assert res.active_count == 1
         assert res.inactive_count == 0
 
+    def test_user_list_response_counts_mixed_statuses(self):
+        """Test that active and inactive counts are computed in one pass."""
+        statuses = [
+            UserStatusEnum.ACTIVE,
+            UserStatusEnum.INACTIVE,
+            UserStatusEnum.ACTIVE,
+            UserStatusEnum.SUSPENDED,
+        ]
+        users = [
+            UserEntity(
+                user_id=index,
+                name=f"User {chr(64 + index)}",
+                email=f"user{index}@example.com",
+                status=status,
+            )
+            for index, status in enumerate(statuses, start=1)
+        ]
 
-class TestUpdateUserStatusRequest:
-    """Test suite for the UpdateUserStatusRequest schema."""
-
-    def test_update_user_status_request_success(self):
-        """Test successful creation of an UpdateUserStatusRequest."""
-        req = UpdateUserStatusRequest(status=UserStatusEnum.ACTIVE)
-        assert req.status == "active"
+        res = UserListResponse.from_entities(users)
 
-    def test_update_user_status_invalid_status(self):
-        """Test that an invalid status raises a validation error."""
-        with pytest.raises(ValidationError):
-            UpdateUserStatusRequest(status="INVALID_STATUS")
+        assert [user.user_id for user in res.users] == [1, 2, 3, 4]
+        assert res.total_count == 4
+        assert res.active_count == 2
+        assert res.inactive_count == 2
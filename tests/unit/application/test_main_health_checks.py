@@ -88,6 +88,7 @@ class TestHealthCheckEndpoints:
         assert data["service"] == "task-manager"
         assert "environment" in data
         assert "timestamp" in data
+        assert response.headers["Content-Length"] == str(len(response.data))
 
     def test_health_check_response_format(self, app):
         """Test that health check response has correct format"""
@@ -119,6 +120,76 @@ class TestHealthCheckEndpoints:
             assert "application/json" in response.content_type
 
 
+class TestApplicationFactory:
+    """Test that the application factory wires everything exactly once"""
+
+    def test_blueprints_and_hooks_registered_once(self):
+        """Test that blueprints and after_request hooks are not duplicated"""
+        with patch("application.main.database_connection"):
+            app = create_application()
+
+        hooks = [func.__name__ for func in app.after_request_funcs.get(None, [])]
+
+        assert len(app.blueprints) == 2
+        assert hooks == ["cors_after_request", "add_security_headers"]
+
+    def test_trailing_slash_does_not_redirect(self):
+        """Test that a trailing slash is routed directly instead of redirected"""
+        with patch("application.main.database_connection"):
+            client = create_application().test_client()
+
+        response = client.get("/api/users/")
+
+        assert response.status_code == 200
+
+
+class TestLivenessProbe:
+    """Test the WSGI-level /healthz liveness probe"""
+
+    @pytest.fixture
+    def app(self):
+        """Create test Flask application"""
+        with patch("application.main.database_connection") as mock_db:
+            mock_db.health_check.return_value = True
+            app = create_application()
+            app.config["TESTING"] = True
+            yield app.test_client()
+
+    def test_healthz_returns_ok(self, app):
+        """Test that /healthz answers without touching the database"""
+        with patch("application.main.database_connection") as mock_db:
+            response = app.get("/healthz")
+
+            assert response.status_code == 200
+            assert json.loads(response.data) == {"status": "ok"}
+            assert response.headers["Content-Length"] == str(len(response.data))
+            mock_db.health_check.assert_not_called()
+
+    def test_healthz_head_returns_headers_only(self, app):
+        """Test that HEAD probes are answered without a body"""
+        response = app.head("/healthz")
+
+        assert response.status_code == 200
+        assert response.data == b""
+        assert response.headers["Content-Type"] == "application/json"
+
+    def test_healthz_only_handles_get_and_head(self, app):
+        """Test that other methods fall through to Flask"""
+        response = app.post("/healthz")
+        assert response.status_code == 405
+
+    def test_healthz_route_serves_dispatch_without_middleware(self):
+        """Test that /healthz works when app.wsgi_app is bypassed (Lambda)"""
+        with patch("application.main.database_connection") as mock_db:
+            flask_app = create_application()
+            with flask_app.test_request_context("/healthz", method="GET"):
+                response = flask_app.full_dispatch_request()
+
+            assert response.status_code == 200
+            assert json.loads(response.get_data()) == {"status": "ok"}
+            mock_db.health_check.assert_not_called()
+
+
 class TestDeprecatedEndpoints:
     """Test that deprecated endpoints no longer exist"""
 
@@ -5,6 +5,7 @@ import pytest
 from domain.entities.task_entity import TaskEntity
 from domain.enums.task_status_enum import TaskPriorityEnum, TaskStatusEnum
 from domain.exceptions.business_exceptions import (
+    InvalidTaskTransitionException,
     TaskAlreadyCancelledException,
     TaskAlreadyCompletedException,
 )
@@ -35,6 +36,16 @@ class TestTaskEntity:
         assert isinstance(task.created_at, datetime)
         assert task.completed_at is None
 
+    def test_updated_at_defaults_to_created_at(self):
+        """
+        Verify that an omitted updated_at takes the creation timestamp.
+        """
+        created_at = datetime(2025, 1, 27, 14, 30, tzinfo=timezone.utc)
+        task = TaskEntity(
+            title="Test", description="Desc", user_id=1, created_at=created_at
+        )
+        assert task.updated_at == created_at
+
     @pytest.mark.parametrize(
         "title, description, user_id",
         [
@@ -111,6 +122,15 @@ class TestTaskEntity:
         with pytest.raises(TaskAlreadyCancelledException):
             task_cancelled.start_task()
 
+    def test_cannot_start_an_in_progress_task(self):
+        """
+        Verify that starting a task that is already in progress is rejected.
+        """
+        task = TaskEntity.create_new_task("Test", "Desc", 1)
+        task.start_task()
+        with pytest.raises(InvalidTaskTransitionException):
+            task.start_task()
+
     def test_cancel_task_transitions_status_correctly(self):
         """
         Verify that cancelling a task correctly changes its status to CANCELLED.
@@ -133,6 +153,28 @@ class TestTaskEntity:
         task.update_task(description=new_desc)
         assert task.description == new_desc
 
+    @pytest.mark.parametrize(
+        "changes",
+        [{"title": "   "}, {"title": "T" * 201}, {"description": ""}],
+    )
+    def test_update_task_with_invalid_data_raises_exception(self, changes):
+        """
+        Verify that update_task validates the edited fields.
+        """
+        task = TaskEntity.create_new_task("Original Title", "Original Desc", 1)
+        with pytest.raises(ValueError):
+            task.update_task(**changes)
+        assert task.title == "Original Title"
+        assert task.description == "Original Desc"
+
+    def test_update_task_strips_new_values(self):
+        """
+        Verify that update_task strips surrounding whitespace like creation does.
+        """
+        task = TaskEntity.create_new_task("Original Title", "Original Desc", 1)
+        task.update_task(title="  New Title  ")
+        assert task.title == "New Title"
+
     def test_cannot_update_terminal_task(self):
         """
         Verify that a completed or cancelled task's details cannot be updated.
@@ -164,3 +206,34 @@ class TestTaskEntity:
         completed_old_task.created_at = datetime.now(timezone.utc) - timedelta(days=400)
         completed_old_task.complete()  # Complete directly from pending
         assert not completed_old_task.is_overdue()
+
+    def test_complete_uses_one_timestamp_for_completion_and_update(self):
+        """
+        Verify that completing a task stamps completed_at and updated_at identically.
+        """
+        task = TaskEntity.create_new_task("Test", "Desc", 1)
+        task.complete()
+        assert task.completed_at == task.updated_at
+
+    def test_complete_accepts_a_completion_time(self):
+        """
+        Verify that a caller-supplied completion time is used for both timestamps.
+        """
+        task = TaskEntity.create_new_task("Test", "Desc", 1)
+        when = task.created_at + timedelta(hours=1)
+
+        task.complete(when)
+
+        assert task.completed_at == when
+        assert task.updated_at == when
+
+    def test_age_and_overdue_accept_a_reference_time(self):
+        """
+        Verify that a caller-supplied reference time is used for age calculations.
+        """
+        task = TaskEntity.create_new_task("Test", "Desc", 1)
+        later = task.created_at + timedelta(days=10)
+
+        assert task.get_age_in_days(now=later) == 10
+        assert task.is_overdue(days_threshold=5, now=later)
+        assert not task.is_overdue(days_threshold=10, now=later)
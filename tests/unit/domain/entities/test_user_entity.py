@@ -39,6 +39,9 @@ class TestUserEntity:
             (1, " ", "email@test.com"),  # Whitespace name
             (1, "John Doe", "invalid-email"),  # Invalid email
             (1, "John Doe", "email@.com"),  # Invalid email
+            (1, "John Doe", "john doe@example.com"),  # Whitespace in email
+            (1, "John Doe", "john@example"),  # Missing top-level domain
+            (1, "John Doe", "john@example..com"),  # Empty domain label
         ],
     )
     def test_create_user_with_invalid_data_raises_exception(self, user_id, name, email):
@@ -154,3 +157,25 @@ class TestUserEntity:
 
         with pytest.raises(Exception):  # Pydantic validation exception
             user2.change_email("invalid-email-format")
+
+    def test_change_email_rejects_trailing_newline(self):
+        """
+        Verify that change_email applies the same rule as the constructor.
+        """
+        user = UserEntity(
+            user_id=1,
+            name="Test User",
+            email="test@test.com",
+            status=UserStatusEnum.ACTIVE,
+        )
+
+        with pytest.raises(ValueError):
+            user.change_email("new@email.com\n")
+        with pytest.raises(ValueError):
+            UserEntity(
+                user_id=2,
+                name="Test User",
+                email="new@email.com\n",
+                status=UserStatusEnum.ACTIVE,
+            )
+        assert user.email == "test@test.com"
@@ -0,0 +1,63 @@
+import copy
+import pickle
+
+import pytest
+
+from domain.exceptions.business_exceptions import (
+    BusinessException,
+    InvalidTaskTransitionException,
+    MaxTasksExceededException,
+    TaskNotFoundException,
+)
+
+
+def _round_trips():
+    """Copy and serialization round trips an exception must survive"""
+    return [
+        copy.copy,
+        copy.deepcopy,
+        lambda exc: pickle.loads(pickle.dumps(exc)),
+    ]
+
+
+class TestBusinessExceptionCopyAndPickle:
+    """Test that slot attributes survive copy and pickle round trips."""
+
+    @pytest.mark.parametrize("round_trip", _round_trips())
+    def test_task_not_found_round_trip(self, round_trip):
+        """Test that the message and details are not rebuilt from args."""
+        original = TaskNotFoundException(task_id="abc")
+
+        restored = round_trip(original)
+
+        assert type(restored) is TaskNotFoundException
+        assert restored.message == "Task with ID 'abc' not found"
+        assert restored.error_code == original.error_code
+        assert restored.http_status_code == 404
+        assert restored.details == {"resource_type": "Task", "resource_id": "abc"}
+        assert str(restored) == str(original)
+        assert restored.to_dict() == original.to_dict()
+
+    @pytest.mark.parametrize("round_trip", _round_trips())
+    def test_subclass_with_custom_constructor_round_trip(self, round_trip):
+        """Test exceptions whose constructors do not take a message."""
+        original = MaxTasksExceededException(user_id=7, current_count=3, max_allowed=3)
+        transition = InvalidTaskTransitionException(
+            task_id="t1", current_status="completed", target_status="pending"
+        )
+
+        for exc in (original, transition):
+            restored = round_trip(exc)
+            assert restored.to_dict() == exc.to_dict()
+
+    @pytest.mark.parametrize("round_trip", _round_trips())
+    def test_default_details_round_trip(self, round_trip):
+        """Test that the shared read-only empty details default is kept."""
+        original = BusinessException("Plain failure", "VALIDATION_ERROR")
+
+        restored = round_trip(original)
+
+        assert restored.details == {}
+        with pytest.raises(TypeError):
+            restored.details["key"] = "value"
+        assert restored.to_dict() == original.to_dict()
@@ -0,0 +1,59 @@
+from pydantic import BaseModel, ValidationError
+
+from domain.exceptions.business_exceptions import (
+    BusinessException,
+    TaskNotFoundException,
+)
+from domain.exceptions.error_mapping import (
+    get_mapping,
+    register_infrastructure_exception,
+)
+
+
+class _Model(BaseModel):
+    value: int
+
+
+class TestGetMapping:
+    """Test exception to (status code, error type) resolution."""
+
+    def test_standard_exception_matches_exact_type(self):
+        """Test that registered standard types keep their mapping."""
+        assert get_mapping(ValueError("bad")) == (400, "INVALID_REQUEST")
+        assert get_mapping(KeyError("missing")) == (400, "MISSING_REQUIRED_FIELD")
+
+    def test_standard_exception_subclass_uses_default(self):
+        """Test that subclasses of standard types are not matched by base."""
+        error = UnicodeDecodeError("utf-8", b"\xff", 0, 1, "invalid start byte")
+
+        assert get_mapping(error) == (500, "INTERNAL_ERROR")
+        assert get_mapping(FileNotFoundError()) == (500, "INTERNAL_ERROR")
+
+    def test_pydantic_validation_error(self):
+        """Test that pydantic validation errors map to 400."""
+        try:
+            _Model(value="not-a-number")
+        except ValidationError as e:
+            assert get_mapping(e) == (400, "VALIDATION_ERROR")
+
+    def test_business_exception_uses_own_codes(self):
+        """Test that business exceptions carry their own status and code."""
+        assert get_mapping(TaskNotFoundException(task_id="abc")) == (
+            404,
+            "TASK_NOT_FOUND",
+        )
+        assert get_mapping(BusinessException("Rule", "CUSTOM", 409)) == (
+            409,
+            "CUSTOM",
+        )
+
+    def test_registered_infrastructure_exception(self):
+        """Test that registering a type takes effect on the next lookup."""
+
+        class _StorageError(Exception):
+            pass
+
+        assert get_mapping(_StorageError()) == (500, "INTERNAL_ERROR")
+        register_infrastructure_exception(_StorageError, 503, "STORAGE_UNAVAILABLE")
+
+        assert get_mapping(_StorageError()) == (503, "STORAGE_UNAVAILABLE")
@@ -0,0 +1,109 @@
+"""
+Unit Tests for BulkCompleteTasksUseCase
+
+Unit tests following AAA pattern for bulk task completion, checking that
+the gateway is hit once for lookup and once for save.
+
+Test Categories:
+- Happy path bulk completion
+- Missing tasks
+- Invalid state transitions
+"""
+
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from domain.entities.task_entity import TaskEntity
+from domain.enums.task_status_enum import TaskStatusEnum
+from domain.exceptions.business_exceptions import (
+    TaskAlreadyCompletedException,
+    TaskNotFoundException,
+)
+from domain.gateways.task_gateway import TaskGateway
+from domain.usecases.bulk_complete_tasks_use_case import BulkCompleteTasksUseCase
+
+
+def _new_task(title: str) -> TaskEntity:
+    return TaskEntity.create_new_task(
+        title=title, description="Bulk completion test", user_id=1
+    )
+
+
+class TestBulkCompleteTasksUseCase:
+    """Test suite for BulkCompleteTasksUseCase."""
+
+    def test_execute_should_complete_all_tasks_with_one_lookup_and_one_save(
+        self, mock_task_gateway: MagicMock
+    ):
+        """Test that every task is completed using batch gateway calls."""
+        # Arrange
+        first, second = _new_task("First"), _new_task("Second")
+        second.start_task()
+        # Gateway returns tasks in arbitrary order
+        mock_task_gateway.find_tasks_by_ids.return_value = [second, first]
+        use_case = BulkCompleteTasksUseCase(mock_task_gateway)
+        task_ids = [first.task_id, second.task_id, first.task_id]
+
+        # Act
+        result = use_case.execute(task_ids)
+
+        # Assert
+        assert result == [first, second]
+        assert all(task.status == TaskStatusEnum.COMPLETED for task in result)
+        assert first.completed_at is not None
+        assert first.completed_at == second.completed_at
+        mock_task_gateway.find_tasks_by_ids.assert_called_once_with(
+            [first.task_id, second.task_id]
+        )
+        mock_task_gateway.save_tasks.assert_called_once_with([first, second])
+        mock_task_gateway.find_task_by_id.assert_not_called()
+        mock_task_gateway.save_task.assert_not_called()
+
+    def test_execute_should_raise_when_any_task_is_missing(
+        self, mock_task_gateway: MagicMock
+    ):
+        """Test that nothing is saved when one of the tasks does not exist."""
+        # Arrange
+        task = _new_task("Existing")
+        mock_task_gateway.find_tasks_by_ids.return_value = [task]
+        use_case = BulkCompleteTasksUseCase(mock_task_gateway)
+
+        # Act & Assert
+        with pytest.raises(TaskNotFoundException):
+            use_case.execute([task.task_id, uuid4()])
+        assert task.status == TaskStatusEnum.PENDING
+        mock_task_gateway.save_tasks.assert_not_called()
+
+    def test_execute_should_raise_when_any_task_is_already_completed(
+        self, mock_task_gateway: MagicMock
+    ):
+        """Test that nothing is saved when one task cannot be completed."""
+        # Arrange
+        pending, completed = _new_task("Pending"), _new_task("Completed")
+        completed.complete()
+        mock_task_gateway.find_tasks_by_ids.return_value = [pending, completed]
+        use_case = BulkCompleteTasksUseCase(mock_task_gateway)
+
+        # Act & Assert
+        with pytest.raises(TaskAlreadyCompletedException):
+            use_case.execute([pending.task_id, completed.task_id])
+        assert pending.status == TaskStatusEnum.PENDING
+        assert pending.completed_at is None
+        mock_task_gateway.save_tasks.assert_not_called()
+
+    def test_execute_with_no_ids_returns_empty_list(self, mock_task_gateway: MagicMock):
+        """Test that an empty request completes nothing."""
+        mock_task_gateway.find_tasks_by_ids.return_value = []
+        use_case = BulkCompleteTasksUseCase(mock_task_gateway)
+
+        assert use_case.execute([]) == []
+        mock_task_gateway.save_tasks.assert_called_once_with([])
+
+
+# Fixtures
+@pytest.fixture
+def mock_task_gateway():
+    """Mock task gateway."""
+    return MagicMock(spec=TaskGateway)
@@ -99,6 +99,49 @@ class TestTaskRepository:
         assert result is None
         mock_session.get.assert_called_once()
 
+    def test_save_tasks_commits_once(self, mock_session, task_entity):
+        """Test that several tasks are merged and committed together."""
+        other = task_entity.model_copy(update={"task_id": uuid4()})
+        repo = TaskRepository(mock_session)
+
+        repo.save_tasks([task_entity, other])
+
+        assert mock_session.merge.call_count == 2
+        mock_session.commit.assert_called_once()
+        mock_session.rollback.assert_not_called()
+
+    def test_save_tasks_integrity_error(self, mock_session, task_entity):
+        """Test that a failed batch save is rolled back."""
+        mock_session.commit.side_effect = IntegrityError(
+            "mocked integrity error", [], None
+        )
+        repo = TaskRepository(mock_session)
+
+        with pytest.raises(DatabaseException):
+            repo.save_tasks([task_entity])
+
+        mock_session.rollback.assert_called_once()
+
+    def test_find_tasks_by_ids_uses_single_query(self, mock_session, task_entity):
+        """Test that several tasks are loaded with one query."""
+        model = TaskModelMapper.entity_to_model(task_entity)
+        query = mock_session.query.return_value
+        query.filter.return_value.all.return_value = [model]
+        repo = TaskRepository(mock_session)
+
+        result = repo.find_tasks_by_ids([task_entity.task_id, uuid4()])
+
+        assert [task.task_id for task in result] == [task_entity.task_id]
+        mock_session.query.assert_called_once_with(TaskModel)
+        query.filter.return_value.all.assert_called_once()
+
+    def test_find_tasks_by_ids_empty_skips_query(self, mock_session):
+        """Test that an empty id list does not hit the database."""
+        repo = TaskRepository(mock_session)
+
+        assert repo.find_tasks_by_ids([]) == []
+        mock_session.query.assert_not_called()
+
 
 class TestTaskModelMapper:
     """Test suite for the TaskModelMapper."""
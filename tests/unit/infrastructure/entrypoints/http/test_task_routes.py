@@ -0,0 +1,83 @@
+"""
+Unit Tests for Task HTTP Routes
+
+Tests for the bulk completion endpoint, with the use case replaced in the
+container so no database is needed.
+"""
+
+import json
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from application.main import create_application
+from domain.entities.task_entity import TaskEntity
+from domain.exceptions.business_exceptions import TaskAlreadyCompletedException
+
+
+class TestBulkCompleteTasksRoute:
+    """Test PUT /api/tasks/complete"""
+
+    @pytest.fixture
+    def app(self):
+        """Create test Flask application"""
+        with patch("application.main.database_connection") as mock_db:
+            mock_db.health_check.return_value = True
+            app = create_application()
+            app.config["TESTING"] = True
+            yield app
+
+    def test_complete_tasks_returns_completed_tasks(self, app):
+        """Test that every requested task is returned completed"""
+        tasks = [
+            TaskEntity.create_new_task(
+                title=f"Task {i}", description="Bulk route test", user_id=1
+            )
+            for i in range(2)
+        ]
+        for task in tasks:
+            task.complete()
+        use_case = MagicMock()
+        use_case.execute.return_value = tasks
+        app.container.bulk_complete_tasks_use_case = use_case
+
+        response = app.test_client().put(
+            "/api/tasks/complete",
+            json={"task_ids": [str(task.task_id) for task in tasks]},
+        )
+
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert data["total_count"] == 2
+        assert [row["task_id"] for row in data["tasks"]] == [
+            str(task.task_id) for task in tasks
+        ]
+        assert all(row["status"] == "completed" for row in data["tasks"])
+        use_case.execute.assert_called_once_with([task.task_id for task in tasks])
+
+    def test_complete_tasks_with_empty_list_is_rejected(self, app):
+        """Test that an empty ID list fails validation"""
+        use_case = MagicMock()
+        app.container.bulk_complete_tasks_use_case = use_case
+
+        response = app.test_client().put("/api/tasks/complete", json={"task_ids": []})
+
+        assert response.status_code == 400
+        use_case.execute.assert_not_called()
+
+    def test_complete_tasks_already_completed_maps_to_error(self, app):
+        """Test that a rejected batch returns the business error"""
+        task_id = uuid4()
+        use_case = MagicMock()
+        use_case.execute.side_effect = TaskAlreadyCompletedException(
+            task_id=task_id, attempted_operation="complete"
+        )
+        app.container.bulk_complete_tasks_use_case = use_case
+
+        response = app.test_client().put(
+            "/api/tasks/complete", json={"task_ids": [str(task_id)]}
+        )
+
+        assert response.status_code == 422
+        assert json.loads(response.data)["error"]["code"] == "TASK_ALREADY_COMPLETED"
@@ -7,6 +7,7 @@ from unittest.mock import Mock, patch
 import pytest
 
 from domain.exceptions.business_exceptions import (
+    BusinessException,
     TaskNotFoundException,
     UserNotActiveException,
     UserNotFoundException,
@@ -76,6 +77,29 @@ class TestHTTPErrorHandler:
             assert response_data["error"]["path"] == "/api/tasks"
             assert response_data["error"]["method"] == "POST"
 
+    def test_handle_subclass_of_mapped_exception(self):
+        """Test that unregistered subclasses do not inherit their base mapping"""
+
+        class CustomValueError(ValueError):
+            pass
+
+        mock_request = Mock()
+        mock_request.path = "/api/tasks"
+        mock_request.method = "POST"
+        mock_request.request_id = "test-request-id"
+
+        with patch(
+            "infrastructure.helpers.errors.error_handlers.request",
+            mock_request,
+        ):
+            for _ in range(2):  # second call is served from the memoized lookup
+                response_data, status_code = HTTPErrorHandler.handle_exception(
+                    CustomValueError("Invalid value")
+                )
+
+                assert status_code == 500
+                assert response_data["error"]["type"] == "INTERNAL_ERROR"
+
     def test_handle_exception_without_request_context(self):
         """Test handling exceptions without request context"""
         exception = TaskNotFoundException("Task not found")
@@ -197,6 +221,23 @@ class TestHTTPErrorHandler:
                 assert response_data["error"]["exception_type"] == "Exception"
                 assert response_data["error"]["exception_message"] == "Internal error"
 
+    def test_exception_details_do_not_mutate_exception(self):
+        """Test that debug details are built on a copy of the exception details"""
+        exception = BusinessException(
+            "Invalid title",
+            "VALIDATION_ERROR",
+            details={"field": "title"},
+            inner_exception=ValueError("too long"),
+        )
+
+        with patch.object(
+            HTTPErrorHandler, "_should_include_details", return_value=True
+        ):
+            details = HTTPErrorHandler._get_exception_details(exception)
+
+        assert details == {"field": "title", "inner_error": "too long"}
+        assert exception.details == {"field": "title"}
+
 
 class TestErrorResponseBuilder:
     """Test error response builder"""
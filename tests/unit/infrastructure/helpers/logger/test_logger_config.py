@@ -0,0 +1,79 @@
+"""
+Tests for logger configuration
+"""
+
+import io
+import logging
+import threading
+import time
+
+from infrastructure.helpers.logger import logger_config
+from infrastructure.helpers.logger.logger_config import (
+    _InProcessQueueHandler,
+    get_logger,
+)
+
+
+def _wait_for(predicate, timeout: float = 2.0) -> bool:
+    """Poll until the listener thread has written the expected output"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return predicate()
+
+
+class TestQueueLogging:
+    """Test the queue-based logging pipeline"""
+
+    def test_exception_is_formatted_by_listener_thread(self, monkeypatch):
+        """Test that a record with exc_info is rendered off the calling thread"""
+        listener = logger_config._queue_listener
+        assert listener is not None
+        handler = listener.handlers[0]
+
+        stream = io.StringIO()
+        monkeypatch.setattr(handler, "stream", stream)
+
+        formatting_threads = []
+        original_format = handler.format
+
+        def spy_format(record):
+            formatting_threads.append(threading.current_thread())
+            return original_format(record)
+
+        monkeypatch.setattr(handler, "format", spy_format)
+
+        # Route this logger straight into the listener's queue (pytest owns
+        # the root handlers during the run)
+        stdlib_logger = logging.getLogger("test.listener")
+        monkeypatch.setattr(stdlib_logger, "handlers", [])
+        monkeypatch.setattr(stdlib_logger, "propagate", False)
+        stdlib_logger.addHandler(_InProcessQueueHandler(listener.queue))
+
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            get_logger("test.listener").error("unhandled_exception", exc_info=True)
+
+        assert _wait_for(lambda: "ValueError: boom" in stream.getvalue())
+        output = stream.getvalue()
+        assert "unhandled_exception" in output
+        assert "Traceback" in output
+        assert formatting_threads
+        assert threading.current_thread() not in formatting_threads
+
+    def test_foreign_record_args_are_merged_before_enqueueing(self):
+        """Test that mutable %-args cannot change after the call site"""
+        handler = _InProcessQueueHandler(None)
+        items = [1]
+        record = logging.LogRecord(
+            "third.party", logging.INFO, __file__, 1, "items=%s", (items,), None
+        )
+
+        prepared = handler.prepare(record)
+        items.append(2)
+
+        assert prepared.getMessage() == "items=[1]"
+        assert prepared.args is None
@@ -0,0 +1,37 @@
+"""
+Tests for HTTP Middleware
+
+Tests the opt-in profiling middleware sampling behaviour.
+"""
+
+from unittest.mock import Mock
+
+from infrastructure.helpers.middleware.http_middleware import (
+    SampledProfilerMiddleware,
+)
+
+
+class TestSampledProfilerMiddleware:
+    """Test sampled profiling middleware functionality"""
+
+    def test_only_one_in_n_requests_is_profiled(self, tmp_path):
+        """Test that the profiler only wraps every Nth request"""
+        mock_app = Mock(return_value=[b"ok"])
+        middleware = SampledProfilerMiddleware(
+            mock_app, sample_rate=3, profile_dir=str(tmp_path)
+        )
+        middleware.profiler = Mock(return_value=[b"profiled"])
+
+        results = [middleware({}, Mock()) for _ in range(6)]
+
+        assert results.count([b"profiled"]) == 2
+        assert middleware.profiler.call_count == 2
+        assert mock_app.call_count == 4
+
+    def test_profile_dir_is_created(self, tmp_path):
+        """Test that the profile directory is created on initialization"""
+        profile_dir = tmp_path / "profiles"
+
+        SampledProfilerMiddleware(Mock(), profile_dir=str(profile_dir))
+
+        assert profile_dir.is_dir()
@@ -0,0 +1,52 @@
+"""
+Tests for Response Utilities
+
+Tests that response schemas are serialized directly into JSON responses.
+"""
+
+import json
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from application.schemas.task_schema import TaskResponse
+from application.schemas.user_schema import UserResponse
+from infrastructure.helpers.utils.response_utils import json_model_response
+
+
+class TestJsonModelResponse:
+    """Test JSON responses built from response schemas"""
+
+    def test_json_model_response_serializes_model(self):
+        """Test body, status code and content type of the response"""
+        model = UserResponse(
+            user_id=1, name="Jane Doe", email="jane@example.com", status="active"
+        )
+
+        response = json_model_response(model, 201)
+
+        assert response.status_code == 201
+        assert response.mimetype == "application/json"
+        assert json.loads(response.get_data()) == model.model_dump(mode="json")
+
+    def test_json_model_response_serializes_dataclass(self):
+        """Test that dataclass schemas are encoded with ISO datetimes"""
+        task_id = uuid4()
+        created_at = datetime(2025, 1, 27, 14, 30, tzinfo=timezone.utc)
+        schema = TaskResponse(
+            task_id, "Title", "Description", 1, "pending", "medium", created_at
+        )
+
+        response = json_model_response(schema)
+
+        assert response.status_code == 200
+        assert json.loads(response.get_data()) == {
+            "task_id": str(task_id),
+            "title": "Title",
+            "description": "Description",
+            "user_id": 1,
+            "status": "pending",
+            "priority": "medium",
+            "created_at": "2025-01-27T14:30:00Z",
+            "updated_at": None,
+            "completed_at": None,
+        }